@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.core.security import get_current_active_user
-from app.models.family_role import FamilyRole
+from app.controllers.family_role import get_family_role_name
 from app.models.user import User
 from app.schemas.user import RoleEnum
 from app.schemas.bcc import (
@@ -20,12 +20,17 @@ import app.controllers.bcc as bcc_controller
 
 router = APIRouter(tags=["BCC"])
 
+# Roles that pass the youth committee and BCC access checks outright
+_ADMIN_OR_PASTOR_ROLES = frozenset({RoleEnum.admin, RoleEnum.church_pastor})
+# Family role names (lower-cased) that make an "other" user a youth committee member
+_YOUTH_COMMITTEE_ROLE_NAMES = frozenset({"youth leader", "youth committee"})
+
 
 def require_youth_committee(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> User:
-    if current_user.role in {RoleEnum.admin, RoleEnum.church_pastor}:
+    if current_user.role in _ADMIN_OR_PASTOR_ROLES:
         return current_user
 
     if current_user.role != RoleEnum.other:
@@ -34,16 +39,12 @@ def require_youth_committee(
     if not current_user.family_role_id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    family_role = (
-        db.query(FamilyRole)
-        .filter(FamilyRole.id == current_user.family_role_id)
-        .first()
-    )
-    if not family_role:
+    family_role_name = get_family_role_name(db, current_user.family_role_id)
+    if family_role_name is None:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    role_name = (family_role.name or "").strip().lower()
-    if role_name not in {"youth leader", "youth committee"}:
+    role_name = family_role_name.strip().lower()
+    if role_name not in _YOUTH_COMMITTEE_ROLE_NAMES:
         raise HTTPException(status_code=403, detail="Access denied")
 
     return current_user
@@ -58,7 +59,7 @@ def get_member_progress(
     member = bcc_controller.get_member_with_bcc(db, member_id)
 
     can_view = False
-    if current_user.role in {RoleEnum.admin, RoleEnum.church_pastor}:
+    if current_user.role in _ADMIN_OR_PASTOR_ROLES:
         can_view = True
     elif current_user.role in {RoleEnum.pere, RoleEnum.mere, RoleEnum.other} and current_user.family_id:
         can_view = current_user.family_id == member.family_id
@@ -116,7 +117,7 @@ def get_family_status(
     current_user: User = Depends(get_current_active_user),
 ):
     can_view = False
-    if current_user.role in {RoleEnum.admin, RoleEnum.church_pastor}:
+    if current_user.role in _ADMIN_OR_PASTOR_ROLES:
         can_view = True
     elif current_user.family_id and current_user.family_id == family_id and current_user.role in {
         RoleEnum.pere,
@@ -31,7 +31,7 @@ def read_families(
 ):
     try:
         # If no timestamp filters are provided, use the original function
-        if not any([created_after, created_before, updated_after, updated_before, sort_by]):
+        if not (created_after or created_before or updated_after or updated_before or sort_by):
             families = get_all_families(db)
             return families
         
@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import func, and_
-from sqlalchemy.orm import Session, joinedload
+import base64
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import func, and_, or_, case, update, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload, selectinload
 from typing import Optional, Literal
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 from app.api.routes.family_member import require_parent
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 from app.models.family_activity import Activity
+from app.models.family import Family
 from app.core.security import get_current_active_user
 import app.controllers.family_activity as crud_activity
 import app.schemas.family_activity as activity_schema
@@ -20,9 +24,40 @@ from app.utils.timestamps import (
     apply_timestamp_filters,
     apply_timestamp_sorting
 )
+from app.core.cache import cached, invalidate_family
+from app.utils.http_cache import (
+    PRIVATE_REVALIDATE,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    set_cache_headers,
+)
 
 router = APIRouter(tags=["Activities"])
 
+# Status lookups used in per-row loops, bound once
+_PLANNED = activity_schema.ActivityStatusEnum.planned
+_ONGOING = activity_schema.ActivityStatusEnum.ongoing
+_COMPLETED = activity_schema.ActivityStatusEnum.completed
+_CANCELLED = activity_schema.ActivityStatusEnum.cancelled
+_OVERDUE_STATUSES = frozenset({_PLANNED, _ONGOING})
+
+# Roles allowed to read other families' activities (parents are pinned to their own family)
+_CROSS_FAMILY_ROLES = frozenset({RoleEnum.church_pastor, RoleEnum.other, RoleEnum.admin})
+_PASTOR_OR_PARENT_ROLES = frozenset({RoleEnum.church_pastor, RoleEnum.mere, RoleEnum.pere})
+_PASTOR_OR_PARENT_DETAIL = "Only pastors and parents can access this resource"
+# Non-pastor roles that may read their own family's activities
+_FAMILY_READER_ROLES = frozenset({RoleEnum.mere, RoleEnum.pere, RoleEnum.other, RoleEnum.admin})
+_SUMMARY_STATUS_KEYS = {
+    _PLANNED.value: "planned",
+    _ONGOING.value: "ongoing",
+    _COMPLETED.value: "completed",
+}
+_ALLOWED_STATUS_TRANSITIONS = {
+    _PLANNED: frozenset({_ONGOING, _CANCELLED, _PLANNED}),
+    _ONGOING: frozenset({_COMPLETED, _CANCELLED, _ONGOING}),
+}
+
 
 def _coalesced_start_date_col():
     return func.coalesce(Activity.start_date, Activity.date)
@@ -32,6 +67,14 @@ def _coalesced_end_date_col():
     return func.coalesce(Activity.end_date, Activity.date)
 
 
+# Handlers that only read activity columns refuse lazy relationship loads
+_NO_RELATIONSHIPS = raiseload("*")
+
+
+def _count_where(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
 def _normalize_activity_dates(
     *,
     date_value: Optional[date],
@@ -81,31 +124,148 @@ def _compute_initial_status(
     )
 
 
-def _maybe_promote_planned_to_ongoing(db: Session, activities: list[Activity]) -> None:
+def _maybe_promote_planned_to_ongoing(db: Session, rows: list[dict]) -> None:
+    """Promote due planned activities in a page of activity rows with one UPDATE, patching the rows in place."""
+    planned = [row for row in rows if row["status"] == _PLANNED]
+    if not planned:
+        return
+
     now = datetime.now()
-    changed = False
-    for a in activities:
-        if a.status == activity_schema.ActivityStatusEnum.planned:
-            activity_start = a.start_date or a.date
-            if now >= _activity_start_datetime(activity_start, a.start_time):
-                a.status = activity_schema.ActivityStatusEnum.ongoing
-                changed = True
+    due = {
+        row["id"]: row for row in planned
+        if now >= _activity_start_datetime(row["start_date"] or row["date"], row["start_time"])
+    }
+    if not due:
+        return
+
+    promoted = db.execute(
+        update(Activity.__table__)
+        .where(Activity.id.in_(due))
+        .values(status=_ONGOING)
+        .returning(Activity.id, Activity.updated_at)
+    ).all()
+    db.commit()
+
+    for activity_id, updated_at in promoted:
+        due[activity_id]["status"] = _ONGOING
+        due[activity_id]["updated_at"] = updated_at
+    for promoted_family_id in {row["family_id"] for row in due.values()}:
+        invalidate_family("activities", promoted_family_id)
+
+
+def _fetch_activity_rows(db: Session, query) -> list[dict]:
+    return [dict(row._mapping) for row in db.execute(query)]
+
 
-    if changed:
-        db.commit()
-        for a in activities:
-            db.refresh(a)
+def _activity_rows_to_out(db: Session, rows: list[dict]) -> list[activity_schema.ActivityOut]:
+    family_names = crud_activity.get_family_names(db, (row["family_id"] for row in rows))
+    return crud_activity.convert_rows_to_out(rows, family_names)
+
+
+def _encode_activity_cursor(row: dict) -> str:
+    """Opaque keyset cursor for the default /all ordering (start date desc, family_id asc, id asc)"""
+    raw = f"{(row['start_date'] or row['date']).isoformat()}|{row['family_id']}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_activity_cursor(cursor: str) -> tuple[date, int, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        start_value, family_value, id_value = raw.split("|")
+        return date.fromisoformat(start_value), int(family_value), int(id_value)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _activity_scope_state(db: Session, query) -> tuple[Optional[datetime], int, int, Optional[datetime]]:
+    """
+    Latest updated_at, row count and number of planned activities that may be due
+    for promotion within a filtered activity query, plus the latest family change
+    (family names are part of the rows; used to build list ETags).
+    """
+    latest_update, total, due_for_promotion, families_update = db.execute(query.with_only_columns(
+        func.max(Activity.updated_at),
+        func.count(Activity.id),
+        func.count(Activity.id).filter(
+            and_(
+                Activity.status == activity_schema.ActivityStatusEnum.planned,
+                _coalesced_start_date_col() <= date.today(),
+            )
+        ),
+        select(func.max(Family.updated_at)).scalar_subquery(),
+    )).one()
+    return latest_update, total, due_for_promotion, families_update
+
+
+def _activity_list_etag(
+    db: Session, query, request: Request, current_user: User
+) -> tuple[Optional[str], Optional[datetime]]:
+    """
+    ETag for an activity list response. None while planned activities may still be promoted
+    by the read, since that changes the rows after the validators were computed.
+    """
+    latest_update, total, due_for_promotion, families_update = _activity_scope_state(db, query)
+    if due_for_promotion:
+        return None, latest_update
+    etag = build_etag(
+        latest_update,
+        total,
+        families_update,
+        current_user.role,
+        current_user.family_id,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+    )
+    return etag, latest_update
 
 
 def require_pastor_or_parent(current_user: User):
     """Helper function to check if user is pastor or parent"""
-    if current_user.role not in [RoleEnum.church_pastor, RoleEnum.mere, RoleEnum.pere]:
+    if current_user.role not in _PASTOR_OR_PARENT_ROLES:
         raise HTTPException(
             status_code=403,
-            detail="Only pastors and parents can access this resource"
+            detail=_PASTOR_OR_PARENT_DETAIL
         )
 
 
+def activity_family_scope(
+        allowed_roles: frozenset = frozenset(RoleEnum),
+        denied_detail: str = "Insufficient permissions to access activities",
+):
+    """
+    Dependency factory resolving the family filter of a cross-family activity read.
+    Pastors, admins and "other" users may pick a family with ?family_id= (None means all
+    families); parents are always pinned to their own family.
+    """
+    def resolve_family_scope(
+            family_id: Optional[int] = Query(None),
+            current_user: User = Depends(get_current_active_user),
+    ) -> Optional[int]:
+        if current_user.role not in allowed_roles:
+            raise HTTPException(status_code=403, detail=denied_detail)
+        if current_user.role in _CROSS_FAMILY_ROLES:
+            return family_id
+        if not current_user.family_id:
+            raise HTTPException(status_code=400, detail="User is not assigned to a family.")
+        return current_user.family_id
+
+    return resolve_family_scope
+
+
+def require_family_access(
+        family_id: int,
+        current_user: User = Depends(get_current_active_user),
+) -> int:
+    """Dependency for /{family_id} reads: pastors see any family, everyone else only their own"""
+    if current_user.role == RoleEnum.church_pastor:
+        return family_id
+    if current_user.role not in _FAMILY_READER_ROLES:
+        raise HTTPException(status_code=403, detail="Insufficient permissions to access family activities.")
+    if current_user.family_id != family_id:
+        raise HTTPException(status_code=403, detail="Not authorized to view activities for this family.")
+    return family_id
+
+
 # POST route - create activity
 @router.post("/", response_model=activity_schema.ActivityOut, status_code=status.HTTP_201_CREATED)
 def create_activity(
@@ -145,48 +305,43 @@ def create_activity(
             "status": _compute_initial_status(start_date, end_date, activity_data.start_time, activity_data.end_time)
         }
     )
-    return crud_activity.create_activity(db, activity_data)
+    created = crud_activity.create_activity(db, activity_data)
+    invalidate_family("activities", created.family_id)
+    invalidate_family("family_stats", created.family_id)
+    return created
 
 
 # SPECIFIC ROUTES FIRST - these must come before /{activity_id}
 @router.get("/all", response_model=list[activity_schema.ActivityOut])
+@cached("activities", "all", ttl=60)
 def read_all_activities(
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
         date_from: Optional[date] = Query(None),
         date_to: Optional[date] = Query(None),
         activity_date: Optional[date] = Query(None),
-        family_id: Optional[int] = Query(None),
-        status: Optional[str] = Query(None),
-        category: Optional[str] = Query(None),
+        family_id: Optional[int] = Depends(activity_family_scope()),
+        activity_status: Optional[activity_schema.ActivityStatusEnum] = Query(None, alias="status"),
+        category: Optional[activity_schema.ActivityCategoryEnum] = Query(None),
         created_after: Optional[str] = Query(None),
         created_before: Optional[str] = Query(None),
         updated_after: Optional[str] = Query(None),
         updated_before: Optional[str] = Query(None),
         sort_by: Optional[str] = Query(None, enum=["created_at", "updated_at", "date", "family_id"]),
         sort_order: Optional[str] = Query("desc", enum=["asc", "desc"]),
-        skip: int = Query(0, ge=0),
+        skip: int = Query(0, ge=0, description="Deprecated: offset pagination, prefer cursor"),
         limit: int = Query(100, ge=1, le=1000),
+        cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header of the previous page"),
 ):
-    if current_user.role not in [RoleEnum.church_pastor, RoleEnum.mere, RoleEnum.pere, RoleEnum.other, RoleEnum.admin]:
-        raise HTTPException(
-            status_code=403,
-            detail="Insufficient permissions to access activities",
-        )
+    if cursor and sort_by:
+        raise HTTPException(status_code=400, detail="cursor pagination is only supported with the default sort order")
+    cursor_position = _decode_activity_cursor(cursor) if cursor else None
 
-    # Build base query with joinedload to include family name
-    query = db.query(Activity).options(joinedload(Activity.family))
-
-    if current_user.role == RoleEnum.church_pastor:
-        if family_id:
-            query = query.filter(Activity.family_id == family_id)
-    elif current_user.role in [RoleEnum.other, RoleEnum.admin]:
-        if family_id:
-            query = query.filter(Activity.family_id == family_id)
-    else:
-        if not current_user.family_id:
-            raise HTTPException(status_code=400, detail="User is not assigned to a family.")
-        query = query.filter(Activity.family_id == current_user.family_id)
+    query = crud_activity.select_activity_rows()
+    if family_id:
+        query = query.filter(Activity.family_id == family_id)
 
     # Apply date filters (overlap semantics for ranges)
     start_col = _coalesced_start_date_col()
@@ -200,19 +355,23 @@ def read_all_activities(
             query = query.filter(start_col <= date_to)
 
     # Apply status filter
-    if status:
-        query = query.filter(Activity.status == status)
+    if activity_status:
+        query = query.filter(Activity.status == activity_status)
 
     # Apply category filter
     if category:
         query = query.filter(Activity.category == category)
 
     # Apply timestamp filters
-    has_timestamp_filters = any([created_after, created_before, updated_after, updated_before])
-    if has_timestamp_filters:
+    if created_after or created_before or updated_after or updated_before:
         filters = parse_timestamp_filters(created_after, created_before, updated_after, updated_before)
         query = apply_timestamp_filters(query, Activity, filters)
 
+    # Answer repeat polls with 304 before running the list query
+    etag, last_modified = _activity_list_etag(db, query, request, current_user)
+    if etag and etag_matches(request, etag):
+        return not_modified_response(etag, last_modified)
+
     # Apply sorting
     if sort_by:
         if sort_by == "date":
@@ -222,138 +381,127 @@ def read_all_activities(
         else:
             query = apply_timestamp_sorting(query, Activity, sort_by, sort_order)
     else:
-        query = query.order_by(start_col.desc(), Activity.family_id.asc())
-
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+        query = query.order_by(start_col.desc(), Activity.family_id.asc(), Activity.id.asc())
+
+    # Apply pagination: seek past the cursor row when given, otherwise (deprecated) offset
+    if cursor_position:
+        cursor_start, cursor_family_id, cursor_id = cursor_position
+        query = query.filter(
+            or_(
+                start_col < cursor_start,
+                and_(
+                    start_col == cursor_start,
+                    or_(
+                        Activity.family_id > cursor_family_id,
+                        and_(Activity.family_id == cursor_family_id, Activity.id > cursor_id),
+                    ),
+                ),
+            )
+        )
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
 
-    # Get activities and convert to Pydantic models
-    activities = query.all()
-    _maybe_promote_planned_to_ongoing(db, activities)
-    return crud_activity.convert_activities_to_out(activities)
+    # Fetch plain rows (no ORM hydration) and convert to Pydantic models
+    rows = _fetch_activity_rows(db, query)
+    _maybe_promote_planned_to_ongoing(db, rows)
+    if etag:
+        set_cache_headers(response, etag, last_modified)
+    if not sort_by and len(rows) == limit:
+        response.headers["X-Next-Cursor"] = _encode_activity_cursor(rows[-1])
+    return _activity_rows_to_out(db, rows)
 
 
 @router.get("/stats", response_model=dict)
-def get_activity_statistics(
-        db: Session = Depends(get_db),
+@cached("activities", "stats", ttl=300)
+async def get_activity_statistics(
+        db: AsyncSession = Depends(get_async_db),
         current_user: User = Depends(get_current_active_user),
-        family_id: Optional[int] = Query(None),
+        family_id: Optional[int] = Depends(activity_family_scope(_PASTOR_OR_PARENT_ROLES, _PASTOR_OR_PARENT_DETAIL)),
 ):
-    require_pastor_or_parent(current_user)
-
-    # Build base query with joinedload to include family name
-    query = db.query(Activity).options(joinedload(Activity.family))
-
     # Apply family restrictions
-    if current_user.role == RoleEnum.church_pastor:
-        if family_id:
-            query = query.filter(Activity.family_id == family_id)
-    else:
-        if not current_user.family_id:
-            raise HTTPException(status_code=400, detail="User is not assigned to a family.")
-        query = query.filter(Activity.family_id == current_user.family_id)
-
-    # Get all activities for calculations
-    activities = query.all()
-
-    # Calculate statistics
-    from datetime import datetime, timedelta
-    from collections import defaultdict
+    scope = [Activity.family_id == family_id] if family_id else []
 
-    today = datetime.now().date()
+    # Day/week boundaries use the app clock, like status promotion and the list ETags,
+    # and are bound as parameters so the statement shape stays the same every day.
+    today = date.today()
     week_start = today - timedelta(days=today.weekday())
     week_end = week_start + timedelta(days=6)
 
-    stats = {
-        "total_activities": len(activities),
-        "by_status": defaultdict(int),
-        "by_category": defaultdict(int),
-        "this_week": 0,
-        "upcoming": 0,
-        "overdue": 0,
-        "by_family": defaultdict(int),  # Will store family names instead of IDs
-    }
-
-    for activity in activities:
-        activity_start = activity.start_date or activity.date
-        activity_end = activity.end_date or activity.date
-
-        # Count by status
-        stats["by_status"][activity.status] += 1
-
-        # Count by category
-        stats["by_category"][activity.category] += 1
-
-        # Count by family name
-        family_name = activity.family.name if activity.family else "Unknown"
-        stats["by_family"][family_name] += 1
-
-        # This week activities (overlap semantics)
-        if activity_end >= week_start and activity_start <= week_end:
-            stats["this_week"] += 1
-
-        # Upcoming activities
-        if activity_start > today:
-            stats["upcoming"] += 1
-
-        # Overdue activities
-        if activity_end < today and activity.status in ["Planned", "Ongoing"]:
-            stats["overdue"] += 1
-
-    # Convert defaultdicts to regular dicts
-    stats["by_status"] = dict(stats["by_status"])
-    stats["by_category"] = dict(stats["by_category"])
-    stats["by_family"] = dict(stats["by_family"])
+    start_col = _coalesced_start_date_col()
+    end_col = _coalesced_end_date_col()
 
-    return stats
+    # Scalar counters in one aggregate (overlap semantics for this week)
+    total, this_week, upcoming, overdue = (await db.execute(
+        select(
+            func.count(Activity.id),
+            _count_where(and_(end_col >= week_start, start_col <= week_end)),
+            _count_where(start_col > today),
+            _count_where(and_(end_col < today, Activity.status.in_(_OVERDUE_STATUSES))),
+        ).where(*scope)
+    )).one()
+
+    by_status = (await db.execute(
+        select(Activity.status, func.count(Activity.id)).where(*scope).group_by(Activity.status)
+    )).all()
+    by_category = (await db.execute(
+        select(Activity.category, func.count(Activity.id)).where(*scope).group_by(Activity.category)
+    )).all()
+
+    # Count by family name instead of ID
+    family_name_col = func.coalesce(Family.name, "Unknown")
+    by_family = (await db.execute(
+        select(family_name_col, func.count(Activity.id))
+        .select_from(Activity)
+        .outerjoin(Family, Activity.family_id == Family.id)
+        .where(*scope)
+        .group_by(family_name_col)
+    )).all()
+
+    return {
+        "total_activities": total,
+        "by_status": dict(by_status),
+        "by_category": dict(by_category),
+        "this_week": this_week,
+        "upcoming": upcoming,
+        "overdue": overdue,
+        "by_family": dict(by_family),
+    }
 
 
 @router.get("/type-status-summary", response_model=list[dict])
-def get_activity_type_status_summary(
-        db: Session = Depends(get_db),
+async def get_activity_type_status_summary(
+        db: AsyncSession = Depends(get_async_db),
         current_user: User = Depends(get_current_active_user),
-        family_id: Optional[int] = Query(None),
+        family_id: Optional[int] = Depends(activity_family_scope(_PASTOR_OR_PARENT_ROLES, _PASTOR_OR_PARENT_DETAIL)),
         date_from: Optional[date] = Query(None),
         date_to: Optional[date] = Query(None),
         date_field: Literal["activity_date", "created_at", "updated_at"] = Query("activity_date"),
 ):
-    require_pastor_or_parent(current_user)
-
-    query = db.query(
+    query = select(
         Activity.type,
         Activity.status,
         func.count(Activity.id).label("count"),
     )
-
-    if current_user.role == RoleEnum.church_pastor:
-        if family_id:
-            query = query.filter(Activity.family_id == family_id)
-    else:
-        if not current_user.family_id:
-            raise HTTPException(status_code=400, detail="User is not assigned to a family.")
-        query = query.filter(Activity.family_id == current_user.family_id)
+    if family_id:
+        query = query.filter(Activity.family_id == family_id)
 
     if date_field == "activity_date":
         if date_from:
             query = query.filter(_coalesced_end_date_col() >= date_from)
         if date_to:
             query = query.filter(_coalesced_start_date_col() <= date_to)
-    elif date_field == "created_at":
-        created_date_col = func.date(Activity.created_at)
-        if date_from:
-            query = query.filter(created_date_col >= date_from)
-        if date_to:
-            query = query.filter(created_date_col <= date_to)
-    else:  # updated_at
-        updated_date_col = func.date(Activity.updated_at)
+    else:
+        # Half-open datetime range so the created_at/updated_at indexes can be used.
+        timestamp_col = Activity.created_at if date_field == "created_at" else Activity.updated_at
         if date_from:
-            query = query.filter(updated_date_col >= date_from)
+            query = query.filter(timestamp_col >= datetime.combine(date_from, time.min))
         if date_to:
-            query = query.filter(updated_date_col <= date_to)
+            query = query.filter(timestamp_col < datetime.combine(date_to + timedelta(days=1), time.min))
 
     query = query.group_by(Activity.type, Activity.status)
 
-    rows = query.all()
+    rows = (await db.execute(query)).all()
 
     known_types: list[str] = [
         *[t.value for t in activity_schema.SpiritualTypeEnum],
@@ -382,12 +530,9 @@ def get_activity_type_status_summary(
                 "completed": 0,
             }
 
-        if status_value == activity_schema.ActivityStatusEnum.planned.value:
-            by_type[activity_type]["planned"] += row.count
-        elif status_value == activity_schema.ActivityStatusEnum.ongoing.value:
-            by_type[activity_type]["ongoing"] += row.count
-        elif status_value == activity_schema.ActivityStatusEnum.completed.value:
-            by_type[activity_type]["completed"] += row.count
+        status_key = _SUMMARY_STATUS_KEYS.get(status_value)
+        if status_key:
+            by_type[activity_type][status_key] += row.count
 
     ordered: list[dict] = [by_type[t] for t in known_types if t in by_type]
     extra = sorted(
@@ -398,8 +543,11 @@ def get_activity_type_status_summary(
 
 
 @router.get("/family/{family_id}", response_model=list[activity_schema.ActivityOut])
+@cached("activities", "family", ttl=60)
 def read_activities_for_family(
-        family_id: int,
+        request: Request,
+        response: Response,
+        family_id: int = Depends(require_family_access),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
         date_from: Optional[date] = Query(None),
@@ -412,16 +560,7 @@ def read_activities_for_family(
         sort_by: Optional[str] = Query(None, enum=["created_at", "updated_at", "date"]),
         sort_order: Optional[str] = Query("desc", enum=["asc", "desc"]),
 ):
-    if current_user.role == RoleEnum.church_pastor:
-        pass
-    elif current_user.role in [RoleEnum.mere, RoleEnum.pere, RoleEnum.other, RoleEnum.admin]:
-        if current_user.family_id != family_id:
-            raise HTTPException(status_code=403, detail="Not authorized to view activities for this family.")
-    else:
-        raise HTTPException(status_code=403, detail="Insufficient permissions to access family activities.")
-
-    # Build base query with joinedload to include family name
-    query = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.family_id == family_id)
+    query = crud_activity.select_activity_rows().filter(Activity.family_id == family_id)
 
     # Apply date filters (overlap semantics for ranges)
     start_col = _coalesced_start_date_col()
@@ -435,11 +574,15 @@ def read_activities_for_family(
             query = query.filter(start_col <= date_to)
 
     # Apply timestamp filters
-    has_timestamp_filters = any([created_after, created_before, updated_after, updated_before])
-    if has_timestamp_filters:
+    if created_after or created_before or updated_after or updated_before:
         filters = parse_timestamp_filters(created_after, created_before, updated_after, updated_before)
         query = apply_timestamp_filters(query, Activity, filters)
 
+    # Answer repeat polls with 304 before running the list query
+    etag, last_modified = _activity_list_etag(db, query, request, current_user)
+    if etag and etag_matches(request, etag):
+        return not_modified_response(etag, last_modified)
+
     # Apply sorting
     if sort_by:
         if sort_by == "date":
@@ -449,16 +592,20 @@ def read_activities_for_family(
     else:
         query = query.order_by(start_col.desc())
 
-    # Get activities and convert to Pydantic models
-    activities = query.all()
-    _maybe_promote_planned_to_ongoing(db, activities)
-    return crud_activity.convert_activities_to_out(activities)
+    # Fetch plain rows (no ORM hydration) and convert to Pydantic models
+    rows = _fetch_activity_rows(db, query)
+    _maybe_promote_planned_to_ongoing(db, rows)
+    if etag:
+        set_cache_headers(response, etag, last_modified)
+    return _activity_rows_to_out(db, rows)
 
 
 # PARAMETERIZED ROUTES LAST - these must come after specific routes
 @router.get("/{activity_id}", response_model=activity_schema.ActivityOut)
 def get_activity_by_id(
         activity_id: int,
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
 ):
@@ -469,7 +616,7 @@ def get_activity_by_id(
     if activity.status == activity_schema.ActivityStatusEnum.planned:
         activity_start = activity.start_date or activity.date
         if datetime.now() >= _activity_start_datetime(activity_start, activity.start_time):
-            raw = db.query(Activity).filter(Activity.id == activity_id).first()
+            raw = db.get(Activity, activity_id, options=[_NO_RELATIONSHIPS])
             if raw:
                 raw.status = activity_schema.ActivityStatusEnum.ongoing
                 db.commit()
@@ -485,6 +632,11 @@ def get_activity_by_id(
     else:
         raise HTTPException(status_code=403, detail="Insufficient permissions to view this activity")
 
+    # family_name is joined into the body, so a family rename must change the validator too
+    etag = build_etag(activity.id, activity.updated_at, activity.family_name)
+    if etag_matches(request, etag):
+        return not_modified_response(etag, activity.updated_at, PRIVATE_REVALIDATE)
+    set_cache_headers(response, etag, activity.updated_at, PRIVATE_REVALIDATE)
     return activity
 
 
@@ -497,7 +649,8 @@ def update_activity(
 ):
     require_parent(current_user)
 
-    activity = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.id == activity_id).first()
+    # Family is read when building the response; any other relationship access is a bug
+    activity = db.get(Activity, activity_id, options=[selectinload(Activity.family), raiseload("*")])
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -505,7 +658,7 @@ def update_activity(
     if current_user.family_id != activity.family_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this activity")
 
-    update_payload = updated_data.dict(exclude_unset=True)
+    update_payload = updated_data.model_dump(exclude_unset=True)
 
     if "is_recurring_monthly" in update_payload and update_payload["is_recurring_monthly"] is not None:
         update_payload["is_recurring_monthly"] = 1 if update_payload["is_recurring_monthly"] else 0
@@ -535,51 +688,44 @@ def update_activity(
         if current_status == activity_schema.ActivityStatusEnum.cancelled:
             raise HTTPException(status_code=400, detail="Cancelled activities cannot be modified.")
 
-        allowed_next = {
-            activity_schema.ActivityStatusEnum.planned: {
-                activity_schema.ActivityStatusEnum.ongoing,
-                activity_schema.ActivityStatusEnum.cancelled,
-                activity_schema.ActivityStatusEnum.planned,
-            },
-            activity_schema.ActivityStatusEnum.ongoing: {
-                activity_schema.ActivityStatusEnum.completed,
-                activity_schema.ActivityStatusEnum.cancelled,
-                activity_schema.ActivityStatusEnum.ongoing,
-            },
-        }
-
-        if new_status not in allowed_next.get(current_status, set()):
+        if new_status not in _ALLOWED_STATUS_TRANSITIONS.get(current_status, frozenset()):
             raise HTTPException(status_code=400, detail="Invalid status transition.")
 
         if new_status == activity_schema.ActivityStatusEnum.completed and current_status != activity_schema.ActivityStatusEnum.ongoing:
             raise HTTPException(status_code=400, detail="Only ongoing activities can be marked completed.")
 
-    for field, value in update_payload.items():
-        setattr(activity, field, value)
+    if update_payload.get("status", activity.status) == activity_schema.ActivityStatusEnum.planned:
+        activity_start = update_payload.get("start_date", activity.start_date) or update_payload.get("date", activity.date)
+        start_time = update_payload.get("start_time", activity.start_time)
+        if datetime.now() >= _activity_start_datetime(activity_start, start_time):
+            update_payload["status"] = activity_schema.ActivityStatusEnum.ongoing
 
-    if activity.status == activity_schema.ActivityStatusEnum.planned:
-        activity_start = activity.start_date or activity.date
-        if datetime.now() >= _activity_start_datetime(activity_start, activity.start_time):
-            activity.status = activity_schema.ActivityStatusEnum.ongoing
+    if update_payload:
+        # One UPDATE ... RETURNING refreshes the loaded instance in place (updated_at comes from the column's onupdate).
+        activity = db.execute(
+            update(Activity).where(Activity.id == activity_id).values(**update_payload).returning(Activity)
+        ).scalar_one()
 
-    # updated_at will be automatically set by the middleware
-    db.commit()
-    db.refresh(activity)
+    # Convert to Pydantic model using the existing helper function
+    activity_out = crud_activity.convert_activities_to_out([activity])[0]
 
-    # Refresh check-in window if date/time changed.
+    # Refresh check-in window if date/time changed; this also commits the update above.
     crud_checkin.upsert_checkin_session(db, activity)
+    invalidate_family("activities", activity_out.family_id)
+    invalidate_family("family_stats", activity_out.family_id)
 
-    # Convert to Pydantic model using the existing helper function
-    return crud_activity.convert_activities_to_out([activity])[0]
+    return activity_out
 
 
 @router.get("/{activity_id}/checkin-session", response_model=ActivityCheckinSessionOut)
 def get_checkin_session(
         activity_id: int,
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
 ):
-    activity = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id, options=[_NO_RELATIONSHIPS])
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -591,6 +737,11 @@ def get_checkin_session(
     if not session:
         session = crud_checkin.upsert_checkin_session(db, activity)
 
+    etag = build_etag(activity.id, session.token, session.is_active, session.valid_from, session.valid_until)
+    if etag_matches(request, etag):
+        return not_modified_response(etag, cache_control=PRIVATE_REVALIDATE)
+    set_cache_headers(response, etag, cache_control=PRIVATE_REVALIDATE)
+
     return ActivityCheckinSessionOut(
         activity_id=activity.id,
         token=session.token,
@@ -609,7 +760,7 @@ def create_or_refresh_checkin_session(
 ):
     require_pastor_or_parent(current_user)
 
-    activity = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id, options=[_NO_RELATIONSHIPS])
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -636,7 +787,7 @@ def list_activity_attendances(
 ):
     require_pastor_or_parent(current_user)
 
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id, options=[_NO_RELATIONSHIPS])
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -668,41 +819,46 @@ def delete_activity(
 ):
     require_parent(current_user)
 
-    activity = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.id == activity_id).first()
-    if not activity:
-        raise HTTPException(status_code=404, detail="Activity not found")
-
     # Only allow parents to delete their own family's activities
-    if current_user.family_id != activity.family_id:
+    deleted_id = db.execute(
+        delete(Activity)
+        .where(Activity.id == activity_id, Activity.family_id == current_user.family_id)
+        .returning(Activity.id)
+    ).scalar_one_or_none()
+
+    if deleted_id is None:
+        if not db.get(Activity, activity_id):
+            raise HTTPException(status_code=404, detail="Activity not found")
         raise HTTPException(status_code=403, detail="Not authorized to delete this activity")
 
-    db.delete(activity)
     db.commit()
+    invalidate_family("activities", current_user.family_id)
+    invalidate_family("family_stats", current_user.family_id)
 
 
 # Add this endpoint after the read_activities_for_family route and before the parameterized routes
 
 @router.get("/{family_id}/recent", response_model=list[activity_schema.ActivityOut])
+@cached("activities", "recent", ttl=120)
 def read_recent_activities_for_family(
-        family_id: int,
+        request: Request,
+        response: Response,
+        family_id: int = Depends(require_family_access),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
 ):
-    if current_user.role == RoleEnum.church_pastor:
-        pass
-    elif current_user.role in [RoleEnum.mere, RoleEnum.pere, RoleEnum.other, RoleEnum.admin]:
-        if current_user.family_id != family_id:
-            raise HTTPException(status_code=403, detail="Not authorized to view activities for this family.")
-    else:
-        raise HTTPException(status_code=403, detail="Insufficient permissions to access family activities.")
+    query = crud_activity.select_activity_rows().filter(Activity.family_id == family_id)
 
-    # Build base query with joinedload to include family name
-    query = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.family_id == family_id)
+    etag, last_modified = _activity_list_etag(db, query, request, current_user)
+    if etag and etag_matches(request, etag):
+        return not_modified_response(etag, last_modified, PRIVATE_REVALIDATE)
 
     # Order by date descending and limit to 4
     query = query.order_by(_coalesced_start_date_col().desc()).limit(4)
 
-    # Get activities and convert to Pydantic models
-    activities = query.all()
-    _maybe_promote_planned_to_ongoing(db, activities)
-    return crud_activity.convert_activities_to_out(activities)
\ No newline at end of file
+    # Fetch plain rows (no ORM hydration) and convert to Pydantic models
+    rows = _fetch_activity_rows(db, query)
+    _maybe_promote_planned_to_ongoing(db, rows)
+    if etag:
+        set_cache_headers(response, etag, last_modified, PRIVATE_REVALIDATE)
+    return _activity_rows_to_out(db, rows)
\ No newline at end of file
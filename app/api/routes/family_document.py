@@ -1,55 +1,186 @@
+import base64
+import mimetypes
+import os
+from datetime import datetime
 from typing import Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Body, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, HTTPException, Body, Header, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, contains_eager, load_only
+from pydantic import TypeAdapter
 
 from app.models import Family
 from app.models.family_document import FamilyDocument
-from app.schemas.family_document import DocumentType, DocumentOut, ReportStatus, LetterStatus, ReportCreate, LetterCreate
+from app.schemas.family_document import (
+    DocumentType, DocumentOut, AdminDocumentOut, DocumentFamilyOut, ReportCreate, LetterCreate
+)
 from app.controllers import family_document as doc_controller
+from app.core.config import settings
+from app.db.session import get_async_db
 from app.core.security import get_db, get_current_active_user, get_current_admin_user, get_current_admin_or_pastor_user
 from app.models.user import User
+from app.utils.http_cache import (
+    PRIVATE_FILE,
+    PRIVATE_REVALIDATE,
+    build_etag,
+    etag_matches,
+    not_modified_response,
+    set_cache_headers,
+)
 
-router = APIRouter(tags=["Documents"])
+# Tagged "Documents" where main.py includes it
+router = APIRouter()
+
+# Read size used when streaming stored documents back to the client
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# List serializers: ORM rows are validated and dumped to JSON bytes by pydantic-core in one pass
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(list[DocumentOut])
+_ADMIN_DOCUMENT_LIST_ADAPTER = TypeAdapter(list[AdminDocumentOut])
+# List queries load only the columns the schemas serialize (skipping e.g. file_path, cover_photo)
+_DOCUMENT_OUT_COLUMNS = tuple(getattr(FamilyDocument, name) for name in DocumentOut.model_fields)
+_DOCUMENT_FAMILY_OUT_COLUMNS = tuple(getattr(Family, name) for name in DocumentFamilyOut.model_fields)
+
+
+def _document_list_response(adapter: TypeAdapter, documents: list[FamilyDocument], headers: dict) -> Response:
+    content = adapter.dump_json(adapter.validate_python(documents, from_attributes=True))
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _document_file_response(doc: FamilyDocument, request: Request) -> Response:
+    """
+    Serve a stored document file. Behind nginx (DOCUMENT_X_ACCEL_PREFIX set) the file is
+    handed off with X-Accel-Redirect so nginx sends it with sendfile; otherwise it is
+    streamed from this process. Documents with a stored SHA-256 answer repeat downloads
+    with 304 Not Modified.
+    """
+    if doc.sha256:
+        etag = f'"{doc.sha256}"'
+        if etag_matches(request, etag):
+            return not_modified_response(etag, cache_control=PRIVATE_FILE)
+    if settings.DOCUMENT_X_ACCEL_PREFIX:
+        relative_path = os.path.relpath(doc.file_path, doc_controller.UPLOAD_DIR).replace(os.sep, "/")
+        media_type = mimetypes.guess_type(doc.original_filename or doc.file_path)[0] or "application/octet-stream"
+        return Response(
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": f"{settings.DOCUMENT_X_ACCEL_PREFIX.rstrip('/')}/{quote(relative_path)}",
+                "Content-Disposition": _attachment_disposition(doc.original_filename),
+                "Cache-Control": PRIVATE_FILE,
+                **({"ETag": f'"{doc.sha256}"'} if doc.sha256 else {}),
+            },
+        )
+
+    # FileResponse answers HEAD with headers only, and hands the path to servers offering
+    # the ASGI pathsend extension (e.g. Granian) so they can sendfile it themselves
+    response = FileResponse(doc.file_path, filename=doc.original_filename)
+    response.chunk_size = DOWNLOAD_CHUNK_SIZE
+    response.headers["Cache-Control"] = PRIVATE_FILE
+    if doc.sha256:
+        response.headers["ETag"] = f'"{doc.sha256}"'
+    return response
+
+
+def _attachment_disposition(filename: str) -> str:
+    # Same encoding FileResponse uses for non-ASCII filenames
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+# Above this many rows (planner estimate), unfiltered admin totals are estimated instead of counted
+_EXACT_COUNT_THRESHOLD = 10_000
+
+
+async def _estimated_document_count(db: AsyncSession) -> Optional[int]:
+    """Planner row estimate for family_documents (Postgres only; None when unknown)"""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = await db.scalar(text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'family_documents'::regclass"))
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+def _encode_document_cursor(doc: FamilyDocument) -> str:
+    """Opaque keyset cursor for the document list ordering (uploaded_at desc, id desc)"""
+    raw = f"{doc.uploaded_at.isoformat()}|{doc.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_document_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        uploaded_value, id_value = raw.split("|")
+        return datetime.fromisoformat(uploaded_value), int(id_value)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _paginate_documents(query, cursor: Optional[str], skip: int, limit: Optional[int]):
+    """
+    Seek past the cursor document when given, otherwise (deprecated) offset. One extra
+    row is fetched so callers can tell whether another page follows.
+    """
+    if cursor:
+        uploaded_at, doc_id = _decode_document_cursor(cursor)
+        query = query.filter(tuple_(FamilyDocument.uploaded_at, FamilyDocument.id) < tuple_(uploaded_at, doc_id))
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1) if limit is not None else query
 
 
 @router.get("/", response_model=list[DocumentOut])
 async def list_documents(
-        db: Session = Depends(get_db),
+        request: Request,
+        db: AsyncSession = Depends(get_async_db),
         current_user: User = Depends(get_current_active_user),
-        skip: int = 0,
-        limit: Optional[int] = None,
-        x_total_count: bool = Header(default=False)
+        skip: int = Query(0, ge=0, description="Deprecated: offset pagination, prefer cursor"),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header of the previous page"),
+        include_total: bool = Query(False, description="Return the family's document count in X-Total-Count"),
+        x_total_count: bool = Header(default=False, description="Legacy opt-in for X-Total-Count; prefer include_total")
 ):
     if not current_user.family_id:
         raise HTTPException(status_code=400, detail="User has no assigned family")
 
-    query = db.query(FamilyDocument).filter_by(family_id=current_user.family_id).order_by(
-        FamilyDocument.uploaded_at.desc())
+    # Validators for the family's document list: any upload, edit or delete changes one of them
+    latest_update, total = (await db.execute(
+        select(func.max(FamilyDocument.updated_at), func.count(FamilyDocument.id))
+        .where(FamilyDocument.family_id == current_user.family_id)
+    )).one()
+    want_total = include_total or x_total_count
+    etag = build_etag(current_user.family_id, latest_update, total, skip, limit, cursor, want_total)
+    if etag_matches(request, etag):
+        return not_modified_response(etag, latest_update, PRIVATE_REVALIDATE)
+
+    query = select(FamilyDocument).options(load_only(*_DOCUMENT_OUT_COLUMNS)).where(
+        FamilyDocument.family_id == current_user.family_id
+    ).order_by(FamilyDocument.uploaded_at.desc(), FamilyDocument.id.desc())
 
     # Get total count if requested
-    total_count = query.count() if x_total_count else None
+    total_count = total if want_total else None
 
     # Apply pagination
-    if limit is not None:
-        documents = query.offset(skip).limit(limit).all()
-    else:
-        documents = query.all()
+    documents = (await db.execute(_paginate_documents(query, cursor, skip, limit))).scalars().all()
 
-    # Include total count in response headers
+    # Include total count and the next page cursor in response headers
     headers = {"X-Total-Count": str(total_count)} if total_count is not None else {}
+    if limit is not None and len(documents) > limit:
+        documents = documents[:limit]
+        headers["X-Next-Cursor"] = _encode_document_cursor(documents[-1])
 
-    # Use model_dump to serialize the Pydantic models
-    return JSONResponse(
-        content=[DocumentOut.model_validate(doc).model_dump() for doc in documents],
-        headers=headers
-    )
+    response = _document_list_response(_DOCUMENT_LIST_ADAPTER, documents, headers)
+    set_cache_headers(response, etag, latest_update, PRIVATE_REVALIDATE)
+    return response
 
 
 @router.post("/upload", response_model=DocumentOut)
-def upload_document(
+async def upload_document(
+        background_tasks: BackgroundTasks,
         type: DocumentType,
         file: UploadFile = File(...),
         db: Session = Depends(get_db),
@@ -58,43 +189,57 @@ def upload_document(
     if not current_user.family_id:
         raise HTTPException(status_code=400, detail="User has no assigned family")
 
-    return doc_controller.upload_family_document(db, current_user.family_id, type, file)
+    # Stream the file to disk on the event loop, then record it with the sync session in the threadpool
+    file_path, _, sha256 = await doc_controller.save_document_to_disk(current_user.family_id, file, type)
+    document = await run_in_threadpool(
+        doc_controller.upload_family_document, db, current_user.family_id, type, file, file_path, sha256
+    )
+    background_tasks.add_task(doc_controller.refresh_document_stats)
+    return document
 
 
 @router.post("/report", response_model=DocumentOut)
 def create_report(
+        background_tasks: BackgroundTasks,
         payload: ReportCreate,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
     if not current_user.family_id:
         raise HTTPException(status_code=400, detail="User has no assigned family")
-    return doc_controller.create_structured_report(
+    document = doc_controller.create_structured_report(
         db,
         current_user.family_id,
         payload.title,
         payload.report_data,
     )
+    background_tasks.add_task(doc_controller.refresh_document_stats)
+    return document
 
 
 @router.post("/letter", response_model=DocumentOut)
 def create_letter(
+        background_tasks: BackgroundTasks,
         payload: LetterCreate,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
     if not current_user.family_id:
         raise HTTPException(status_code=400, detail="User has no assigned family")
-    return doc_controller.create_rich_text_letter(
+    document = doc_controller.create_rich_text_letter(
         db,
         current_user.family_id,
         payload.title,
         payload.content_html,
     )
+    background_tasks.add_task(doc_controller.refresh_document_stats)
+    return document
 
 
 @router.get("/{doc_id}/download")
+@router.head("/{doc_id}/download")
 def download_document(
+        request: Request,
         doc_id: int,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
@@ -102,39 +247,37 @@ def download_document(
     doc = doc_controller.get_document_by_id(db, doc_id, current_user.family_id)
     if doc.storage_type != "file":
         raise HTTPException(status_code=400, detail="This document is stored in the database and cannot be downloaded as a file")
-    return FileResponse(doc.file_path, filename=doc.original_filename)
+    return _document_file_response(doc, request)
 
 
 @router.delete("/{doc_id}")
 def delete_document(
+        background_tasks: BackgroundTasks,
         doc_id: int,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
     doc = doc_controller.get_document_by_id(db, doc_id, current_user.family_id)
     doc_controller.delete_document(db, doc)
+    background_tasks.add_task(doc_controller.refresh_document_stats)
     return {"detail": "Document deleted"}
 
 
 @router.patch("/{doc_id}/status")
 def update_document_status(
+        background_tasks: BackgroundTasks,
         doc_id: int,
         status: str = Body(...),
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user)
 ):
-    doc = doc_controller.get_document_by_id(db, doc_id, current_user.family_id)
-
-    # Validate allowed statuses per type
-    if doc.type == DocumentType.report and status not in [s.value for s in ReportStatus]:
-        raise HTTPException(status_code=400, detail="Invalid status for report")
-    if doc.type == DocumentType.letter and status not in [s.value for s in LetterStatus]:
-        raise HTTPException(status_code=400, detail="Invalid status for letter")
+    if not current_user.family_id:
+        raise HTTPException(status_code=400, detail="User has no assigned family")
 
-    doc.status = status
-    db.commit()
-    db.refresh(doc)
-    return {"detail": "Status updated", "status": doc.status}
+    # Validated against the document type and applied in a single UPDATE ... RETURNING
+    new_status = doc_controller.update_document_status(db, doc_id, status, current_user.family_id)
+    background_tasks.add_task(doc_controller.refresh_document_stats)
+    return {"detail": "Status updated", "status": new_status}
 
 
 @router.get("/{doc_id}", response_model=DocumentOut)
@@ -147,112 +290,101 @@ def get_document(
 
 
 @router.get("/all-docs/stats")
-def document_statistics(
-        db: Session = Depends(get_db),
+async def document_statistics(
+        db: AsyncSession = Depends(get_async_db),
         current_user: User = Depends(get_current_active_user),
 ):
-    from sqlalchemy import func
-
-    # Get total count
-    total = db.query(func.count(FamilyDocument.id)).filter_by(family_id=current_user.family_id).scalar()
-
-    # Count by type
-    report_count = db.query(func.count(FamilyDocument.id)).filter_by(
-        family_id=current_user.family_id, type=DocumentType.report
-    ).scalar()
-
-    letter_count = db.query(func.count(FamilyDocument.id)).filter_by(
-        family_id=current_user.family_id, type=DocumentType.letter
-    ).scalar()
-
-    # Count by status "pending"
-    pending_count = db.query(func.count(FamilyDocument.id)).filter_by(
-        family_id=current_user.family_id, status="pending"
-    ).scalar()
+    # Counters come from the family_document_stats view, refreshed after each document write
+    stats = await doc_controller.get_document_stats(db, current_user.family_id)
 
     return {
-        "total_documents": total,
-        "total_reports": report_count,
-        "total_letters": letter_count,
-        "total_pending": pending_count,
+        "total_documents": stats["total"],
+        "total_reports": stats["reports"],
+        "total_letters": stats["letters"],
+        "total_pending": stats["pending"],
     }
 
 
 # ========== ADMIN ENDPOINTS ==========
 
-@router.get("/admin/all")
+@router.get("/admin/all", response_model=list[AdminDocumentOut])
 async def admin_list_all_documents(
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
         current_admin: User = Depends(get_current_admin_or_pastor_user),
-        skip: int = 0,
-        limit: Optional[int] = None,
+        skip: int = Query(0, ge=0, description="Deprecated: offset pagination, prefer cursor"),
+        limit: Optional[int] = Query(None, ge=1),
+        cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header of the previous page"),
         family_id: Optional[int] = None,
         document_type: Optional[DocumentType] = None,
         status: Optional[str] = None,
-        x_total_count: bool = Header(default=False)
+        include_total: bool = Query(
+            False,
+            description="Return the matching document count in X-Total-Count. Without filters, on large tables "
+                        "it is the planner's estimate and X-Total-Count-Estimated is set.",
+        ),
+        x_total_count: bool = Header(default=False, description="Legacy opt-in for X-Total-Count; prefer include_total")
 ):
     """
     Admin endpoint to get all family documents across all families with family details
     """
-    # Join with Family table to get family details
-    query = db.query(FamilyDocument, Family).join(
-        Family, FamilyDocument.family_id == Family.id
-    ).order_by(FamilyDocument.uploaded_at.desc())
+    # Join with Family table to get family details, populating FamilyDocument.family from the join
+    query = select(FamilyDocument).join(FamilyDocument.family).options(
+        load_only(*_DOCUMENT_OUT_COLUMNS),
+        contains_eager(FamilyDocument.family).load_only(*_DOCUMENT_FAMILY_OUT_COLUMNS),
+    ).order_by(FamilyDocument.uploaded_at.desc(), FamilyDocument.id.desc())
 
     # Apply filters
+    conditions = []
     if family_id:
-        query = query.filter(FamilyDocument.family_id == family_id)
+        conditions.append(FamilyDocument.family_id == family_id)
     if document_type:
-        query = query.filter(FamilyDocument.type == document_type)
+        conditions.append(FamilyDocument.type == document_type)
     if status:
-        query = query.filter(FamilyDocument.status == status)
-
-    # Get total count if requested
-    total_count = query.count() if x_total_count else None
+        conditions.append(FamilyDocument.status == status)
+    query = query.where(*conditions)
+    # Every document has a family, so the count needs no join
+    count_query = select(func.count(FamilyDocument.id)).where(*conditions)
+
+    # Get total count if requested. Unfiltered totals over a large table come from planner statistics;
+    # otherwise COUNT(*) OVER () returns the exact total alongside the page in the same query.
+    # Only offset pages see the whole filtered set, so cursor pages (and offsets past the end) still COUNT.
+    want_total = include_total or x_total_count
+    estimated_total = await _estimated_document_count(db) if want_total and not conditions else None
+    if estimated_total is not None and estimated_total < _EXACT_COUNT_THRESHOLD:
+        estimated_total = None
+    exact_total = want_total and estimated_total is None
+    page_query = query.add_columns(func.count().over().label("total")) if exact_total and not cursor else query
 
     # Apply pagination
-    if limit is not None:
-        results = query.offset(skip).limit(limit).all()
+    result = await db.execute(_paginate_documents(page_query, cursor, skip, limit))
+    total_count = None
+    if page_query is not query:
+        rows = result.all()
+        total_count = rows[0].total if rows else (await db.scalar(count_query) if skip else 0)
+        documents = [doc for doc, _ in rows]
     else:
-        results = query.all()
-
-    # Format response with family details
-    documents_with_family = []
-    for doc, family in results:
-        document_dict = {
-            "id": doc.id,
-            "family_id": doc.family_id,
-            "type": doc.type,
-            "original_filename": doc.original_filename,
-            "status": doc.status,
-            "uploaded_at": doc.uploaded_at.isoformat(),
-            "storage_type": getattr(doc, "storage_type", "file"),
-            "title": getattr(doc, "title", None),
-            "content_json": getattr(doc, "content_json", None),
-            "content_html": getattr(doc, "content_html", None),
-            "created_at": doc.created_at.isoformat(),
-            "updated_at": doc.updated_at.isoformat(),
-            "family": {
-                "id": family.id,
-                "category": family.category,
-                "name": family.name,
-                "created_at": family.created_at.isoformat(),
-                "updated_at": family.updated_at.isoformat()
-            }
-        }
-        documents_with_family.append(document_dict)
+        total_count = await db.scalar(count_query) if exact_total else estimated_total
+        documents = result.scalars().all()
+    next_cursor = None
+    if limit is not None and len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = _encode_document_cursor(documents[-1])
 
     # Include total count in response headers
     headers = {"X-Total-Count": str(total_count)} if total_count is not None else {}
+    if estimated_total is not None:
+        headers["X-Total-Count-Estimated"] = "true"
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
 
-    return JSONResponse(
-        content=documents_with_family,
-        headers=headers
-    )
+    # Documents with their family details (loaded by the join above)
+    return _document_list_response(_ADMIN_DOCUMENT_LIST_ADAPTER, documents, headers)
 
 
 @router.get("/admin/{doc_id}/download")
+@router.head("/admin/{doc_id}/download")
 def admin_download_document(
+        request: Request,
         doc_id: int,
         db: Session = Depends(get_db),
         current_admin: User = Depends(get_current_admin_or_pastor_user)
@@ -263,11 +395,12 @@ def admin_download_document(
     doc = doc_controller.get_admin_document_by_id(db, doc_id)
     if doc.storage_type != "file":
         raise HTTPException(status_code=400, detail="This document is stored in the database and cannot be downloaded as a file")
-    return FileResponse(doc.file_path, filename=doc.original_filename)
+    return _document_file_response(doc, request)
 
 
 @router.delete("/admin/{doc_id}")
 def admin_delete_document(
+        background_tasks: BackgroundTasks,
         doc_id: int,
         db: Session = Depends(get_db),
         current_admin: User = Depends(get_current_admin_user)
@@ -277,11 +410,13 @@ def admin_delete_document(
     """
     doc = doc_controller.get_admin_document_by_id(db, doc_id)
     doc_controller.delete_document(db, doc)
+    background_tasks.add_task(doc_controller.refresh_document_stats)
     return {"detail": "Document deleted successfully"}
 
 
 @router.patch("/admin/{doc_id}/status")
 def admin_update_document_status(
+        background_tasks: BackgroundTasks,
         doc_id: int,
         status: str = Body(...),
         db: Session = Depends(get_db),
@@ -290,18 +425,10 @@ def admin_update_document_status(
     """
     Admin endpoint to update document status (only admins can update status)
     """
-    doc = doc_controller.get_admin_document_by_id(db, doc_id)
-
-    # Validate allowed statuses per type
-    if doc.type == DocumentType.report and status not in [s.value for s in ReportStatus]:
-        raise HTTPException(status_code=400, detail="Invalid status for report")
-    if doc.type == DocumentType.letter and status not in [s.value for s in LetterStatus]:
-        raise HTTPException(status_code=400, detail="Invalid status for letter")
-
-    doc.status = status
-    db.commit()
-    db.refresh(doc)
-    return {"detail": "Status updated successfully", "status": doc.status}
+    # Validated against the document type and applied in a single UPDATE ... RETURNING
+    new_status = doc_controller.admin_update_document_status(db, doc_id, status)
+    background_tasks.add_task(doc_controller.refresh_document_stats)
+    return {"detail": "Status updated successfully", "status": new_status}
 
 
 @router.get("/admin/{doc_id}", response_model=DocumentOut)
@@ -318,48 +445,39 @@ def admin_get_document(
 
 
 @router.get("/admin/stats/global")
-def admin_global_statistics(
-    db: Session = Depends(get_db),
+async def admin_global_statistics(
+    db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(get_current_admin_or_pastor_user),
 ):
     """
     Admin endpoint to get global document statistics across all families
     """
-    from sqlalchemy import func
-
-    # Get total count across all families
-    total = db.query(func.count(FamilyDocument.id)).scalar()
-
-    # Count by type
-    report_count = db.query(func.count(FamilyDocument.id)).filter_by(type=DocumentType.report).scalar()
-    letter_count = db.query(func.count(FamilyDocument.id)).filter_by(type=DocumentType.letter).scalar()
-
-    # Count by status
-    pending_count = db.query(func.count(FamilyDocument.id)).filter_by(status="pending").scalar()
-    approved_count = db.query(func.count(FamilyDocument.id)).filter_by(status="approved").scalar()
-    reviewed_count = db.query(func.count(FamilyDocument.id)).filter_by(status="reviewed").scalar()
-    submitted_count = db.query(func.count(FamilyDocument.id)).filter_by(status="submitted").scalar()
-
-    # Count by family (top 10 families with most documents) - include family details
-    family_stats = db.query(
-        Family.id,
-        Family.category,
-        Family.name,
-        func.count(FamilyDocument.id).label('document_count')
-    ).join(FamilyDocument, Family.id == FamilyDocument.family_id).group_by(
-        Family.id, Family.category, Family.name
-    ).order_by(
-        func.count(FamilyDocument.id).desc()
-    ).limit(10).all()
+    # Totals and the top families are read from the precomputed per-family counters
+    stats = await doc_controller.get_document_stats(db)
+    source = doc_controller.document_stats_source(db)
+
+    # Count by family (top 10 families with most documents) - include family details.
+    # The top 10 are picked from the per-family counters first, so only those rows join families.
+    top = select(source.c.family_id, source.c.total).order_by(source.c.total.desc()).limit(10).subquery()
+    family_stats = (await db.execute(
+        select(
+            Family.id,
+            Family.category,
+            Family.name,
+            top.c.total.label('document_count')
+        ).join(top, Family.id == top.c.family_id).order_by(
+            top.c.total.desc()
+        )
+    )).all()
 
     return {
-        "total_documents": total,
-        "total_reports": report_count,
-        "total_letters": letter_count,
-        "total_pending": pending_count,
-        "total_approved": approved_count,
-        "total_reviewed": reviewed_count,
-        "total_submitted": submitted_count,
+        "total_documents": stats["total"],
+        "total_reports": stats["reports"],
+        "total_letters": stats["letters"],
+        "total_pending": stats["pending"],
+        "total_approved": stats["approved"],
+        "total_reviewed": stats["reviewed"],
+        "total_submitted": stats["submitted"],
         "top_families": [
             {
                 "family_id": stat.id,
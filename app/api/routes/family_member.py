@@ -1,17 +1,22 @@
-from datetime import date, timedelta
+import base64
+from datetime import date, datetime, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session, joinedload
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Response, UploadFile, File
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, load_only
 
 from app.controllers import family_member as crud_member
 from app.controllers.family_member import verify_temp_password, create_user_from_member
-from app.db.session import get_db
-from app.core.security import get_current_active_user, get_password_hash
+from app.core.cache import cached, invalidate_family
+from app.db.session import get_async_db, get_db
+from app.core.security import get_current_active_user
 from app.core.permissions import require_parent
 from app.models import Family, Activity
-from app.models.family_member import FamilyMemberInvitation, FamilyMember
+from app.models.family_member import FamilyMember, FamilyMemberPermission
 from app.models.user import User
 from app.schemas.family_activity import ActivityCategoryEnum
 from app.schemas.family_member import (
@@ -20,18 +25,40 @@ from app.schemas.family_member import (
     FamilyMemberUpdate,
     GrantAccessRequest,
     DelegatedAccessOut, MemberActivationResponse, MemberActivationRequest, AccessPermissionEnum, FamilyStats,
-    AgeDistribution, MonthlyTrend
+    AgeDistribution, MonthlyTrend, BulkResendInvitationRequest, BulkResendInvitationResponse
 )
-from app.services.email_service import EmailService
+from app.services.email_service import email_service
 from app.services.profile_upload import profile_upload_service
-from app.utils.timestamps import (
-    parse_timestamp_filters,
-    apply_timestamp_filters,
-    apply_timestamp_sorting
-)
+from app.utils.timestamps import parse_timestamp_filters
 
 router = APIRouter(tags=["Family Members"])
 
+# Member lists are validated once from the ORM rows and dumped straight to JSON, instead of
+# FastAPI dumping and re-validating every row against the response_model
+_MEMBER_LIST_ADAPTER = TypeAdapter(list[FamilyMemberOut])
+_DEFAULT_MEMBER_PAGE_SIZE = 100
+_MAX_MEMBER_PAGE_SIZE = 500
+
+
+def _member_list_response(members: list[FamilyMember], headers: Optional[dict] = None) -> Response:
+    content = _MEMBER_LIST_ADAPTER.dump_json(_MEMBER_LIST_ADAPTER.validate_python(members, from_attributes=True))
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _encode_member_cursor(member: FamilyMember, sort_by: str) -> str:
+    """Opaque keyset cursor for a timestamp-sorted member page (sort timestamp, id)"""
+    raw = f"{getattr(member, sort_by).isoformat()}|{member.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_member_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        timestamp_value, id_value = raw.split("|")
+        return datetime.fromisoformat(timestamp_value), int(id_value)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 # ========================
 # 🚪 Access Management First (Specific routes go before dynamic ones!)
@@ -42,7 +69,7 @@ def grant_access(
     request: GrantAccessRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-):
+) -> Response:
     require_parent(current_user)
 
     if not current_user.family_id:
@@ -50,6 +77,8 @@ def grant_access(
 
     crud_member.grant_permissions_to_member(db, current_user.family_id, request, current_user)
 
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
 
 @router.get("/access", response_model=list[DelegatedAccessOut])
 def list_access_grants(
@@ -69,7 +98,7 @@ def update_access(
     request: GrantAccessRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-):
+) -> Response:
     require_parent(current_user)
 
     if not current_user.family_id:
@@ -77,13 +106,15 @@ def update_access(
 
     crud_member.update_member_permissions(db, current_user.family_id, request, current_user)
 
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
 
 @router.delete("/access/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
 def revoke_access(
     member_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-):
+) -> Response:
     require_parent(current_user)
 
     if not current_user.family_id:
@@ -91,6 +122,8 @@ def revoke_access(
 
     crud_member.revoke_member_permissions(db, current_user.family_id, member_id)
 
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
 
 # ========================
 # 👨‍👩‍👧 Family Member CRUD
@@ -99,6 +132,7 @@ def revoke_access(
 @router.post("/", response_model=FamilyMemberOut, status_code=status.HTTP_201_CREATED)
 def create_member(
     member: FamilyMemberCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -108,13 +142,14 @@ def create_member(
         raise HTTPException(status_code=400, detail="User is not assigned to any family.")
 
     member_data = member.model_copy(update={"family_id": current_user.family_id})
-    db_member = crud_member.create_family_member(db, member_data)
+    db_member = crud_member.create_family_member(db, member_data, background_tasks)
+    invalidate_family("family_stats", current_user.family_id)
     return FamilyMemberOut.model_validate(db_member)
 
 
 @router.get("/", response_model=list[FamilyMemberOut])
-def list_members(
-    db: Session = Depends(get_db),
+async def list_members(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
     created_after: Optional[str] = Query(None, description="Filter members created after this timestamp (ISO 8601)"),
     created_before: Optional[str] = Query(None, description="Filter members created before this timestamp (ISO 8601)"),
@@ -122,25 +157,37 @@ def list_members(
     updated_before: Optional[str] = Query(None, description="Filter members updated before this timestamp (ISO 8601)"),
     sort_by: Optional[str] = Query(None, description="Sort by timestamp field", enum=["created_at", "updated_at"]),
     sort_order: Optional[str] = Query("desc", description="Sort order", enum=["asc", "desc"]),
+    after_id: Optional[int] = Query(None, ge=0, description="Keyset cursor from the X-Next-Cursor header of the previous page (id order)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header of the previous sort_by page"),
+    limit: int = Query(_DEFAULT_MEMBER_PAGE_SIZE, ge=1, le=_MAX_MEMBER_PAGE_SIZE, description="Page size"),
 ):
     require_parent(current_user)
 
     if not current_user.family_id:
         raise HTTPException(status_code=400, detail="User is not assigned to any family.")
 
-    # If no timestamp filters are provided, use the original function
-    if not any([created_after, created_before, updated_after, updated_before, sort_by]):
-        return crud_member.get_family_members_by_family_id(db, current_user.family_id)
-    
     # Parse timestamp filters
     filters = parse_timestamp_filters(created_after, created_before, updated_after, updated_before)
-    
-    # Build query with filters and sorting
-    query = db.query(FamilyMember).filter(FamilyMember.family_id == current_user.family_id)
-    query = apply_timestamp_filters(query, FamilyMember, filters)
-    query = apply_timestamp_sorting(query, FamilyMember, sort_by, sort_order)
-    
-    return query.all()
+
+    # Every listing is a bounded page: member id order by default, or the requested timestamp order
+    if sort_by:
+        if after_id is not None:
+            raise HTTPException(status_code=400, detail="Use cursor, not after_id, to page through sorted members.")
+        after = _decode_member_cursor(cursor) if cursor else None
+        members = await crud_member.get_family_members_sorted_page(
+            db, current_user.family_id, filters, sort_by, sort_order, after, limit
+        )
+    else:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor is only valid with sort_by; use after_id.")
+        members = await crud_member.get_family_members_page(db, current_user.family_id, filters, after_id, limit)
+
+    # The next page cursor goes in a response header, keeping the body a plain list
+    headers = {}
+    if len(members) > limit:
+        members = members[:limit]
+        headers["X-Next-Cursor"] = _encode_member_cursor(members[-1], sort_by) if sort_by else str(members[-1].id)
+    return _member_list_response(members, headers)
 
 
 @router.get("/{member_id}", response_model=FamilyMemberOut)
@@ -151,8 +198,8 @@ def get_member(
 ):
     require_parent(current_user)
 
-    member = crud_member.get_family_member_by_id(db, member_id)
-    if not member or member.family_id != current_user.family_id:
+    member = crud_member.get_family_member_scoped(db, member_id, current_user.family_id)
+    if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
 
     return member
@@ -167,11 +214,13 @@ def update_member(
 ):
     require_parent(current_user)
 
-    member = crud_member.get_family_member_by_id(db, member_id)
-    if not member or member.family_id != current_user.family_id:
+    member = crud_member.get_family_member_scoped(db, member_id, current_user.family_id)
+    if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
 
-    return crud_member.update_family_member(db, member_id, updates)
+    updated = crud_member.update_family_member(db, member_id, updates)
+    invalidate_family("family_stats", current_user.family_id)
+    return updated
 
 
 @router.delete("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -179,15 +228,17 @@ def delete_member(
     member_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-):
+) -> Response:
     require_parent(current_user)
 
-    member = crud_member.get_family_member_by_id(db, member_id)
-    if not member or member.family_id != current_user.family_id:
+    member = crud_member.get_family_member_scoped(db, member_id, current_user.family_id)
+    if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
 
     if not crud_member.delete_family_member(db, member_id):
         raise HTTPException(status_code=500, detail="Failed to delete member.")
+    invalidate_family("family_stats", current_user.family_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post("/{member_id}/profile-photo", response_model=FamilyMemberOut)
@@ -200,8 +251,8 @@ async def upload_member_profile_photo(
     """Upload a profile photo for a family member."""
     require_parent(current_user)
 
-    member = crud_member.get_family_member_by_id(db, member_id)
-    if not member or member.family_id != current_user.family_id:
+    member = crud_member.get_family_member_scoped(db, member_id, current_user.family_id)
+    if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
 
     # Upload the photo
@@ -224,8 +275,8 @@ async def delete_member_profile_photo(
     """Delete a family member's profile photo."""
     require_parent(current_user)
 
-    member = crud_member.get_family_member_by_id(db, member_id)
-    if not member or member.family_id != current_user.family_id:
+    member = crud_member.get_family_member_scoped(db, member_id, current_user.family_id)
+    if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
 
     if member.profile_photo:
@@ -245,6 +296,7 @@ def activate_member_account(
 
     # Create user account
     user = create_user_from_member(db, request.member_id, request.new_password)
+    invalidate_family("family_stats", user.family_id)
 
     return MemberActivationResponse(
         message="Account activated successfully",
@@ -252,17 +304,78 @@ def activate_member_account(
     )
 
 
+@router.post(
+    "/bulk-resend-invitation",
+    response_model=BulkResendInvitationResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def bulk_resend_invitation(
+        request: BulkResendInvitationRequest,
+        background_tasks: BackgroundTasks,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_active_user),
+):
+    """Resend invitation emails to several family members with a single commit and SMTP session"""
+    require_parent(current_user)
+
+    if not current_user.family_id:
+        raise HTTPException(status_code=400, detail="No family assigned to user.")
+
+    members = crud_member.get_family_members_with_invitations(db, request.member_ids, current_user.family_id)
+    family = db.get(Family, current_user.family_id)
+    family_name = family.name if family else "Your Family"
+
+    invitations = []
+    skipped = []
+    for member in members:
+        if not member.email or (member.invitation and member.invitation.is_activated):
+            skipped.append(member.id)
+            continue
+
+        temp_password = email_service.generate_temporary_password()
+        invitations.append(dict(
+            to_email=member.email,
+            member_name=member.name,
+            temp_password=temp_password,
+            family_name=family_name,
+            member_id=member.id,
+        ))
+
+    found = {member.id for member in members}
+    if invitations:
+        crud_member.upsert_member_invitations(
+            db, {invitation["member_id"]: invitation["temp_password"] for invitation in invitations}
+        )
+        db.commit()
+
+    # Emails go out after the response; the new temporary passwords are already saved
+    if invitations:
+        background_tasks.add_task(crud_member.send_invitation_emails_task, invitations)
+
+    return BulkResendInvitationResponse(
+        queued=[invitation["member_id"] for invitation in invitations],
+        skipped=skipped,
+        not_found=[member_id for member_id in dict.fromkeys(request.member_ids) if member_id not in found],
+    )
+
+
 @router.post("/{member_id}/resend-invitation", status_code=status.HTTP_204_NO_CONTENT)
 def resend_invitation(
         member_id: int,
+        background_tasks: BackgroundTasks,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_active_user),
-):
+) -> Response:
     """Resend invitation email to a family member"""
     require_parent(current_user)
 
-    member = crud_member.get_family_member_by_id(db, member_id)
-    if not member or member.family_id != current_user.family_id:
+    if not current_user.family_id:
+        raise HTTPException(status_code=400, detail="No family assigned to user.")
+
+    member = crud_member.get_family_member_scoped(
+        db, member_id, current_user.family_id, with_family=True, with_invitation=True
+    )
+    if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
 
     if not member.email:
@@ -273,38 +386,35 @@ def resend_invitation(
         raise HTTPException(status_code=400, detail="Member has already activated their account.")
 
     # Generate new temporary password and send email
-    email_service = EmailService()
     temp_password = email_service.generate_temporary_password()
 
-    # Update or create invitation
-    if member.invitation:
-        member.invitation.temp_password = get_password_hash(temp_password)
-    else:
-        invitation = FamilyMemberInvitation(
-            member_id=member.id,
-            temp_password=get_password_hash(temp_password)
-        )
-        db.add(invitation)
-
-    db.commit()
+    # Create or update the invitation in one atomic upsert
+    crud_member.upsert_member_invitations(db, {member.id: temp_password})
 
-    # Send email
-    family = db.query(Family).filter(Family.id == member.family_id).first()
-    email_sent = email_service.send_invitation_email(
+    # Read what the email needs before the commit expires the member
+    invitation_email = dict(
         to_email=member.email,
         member_name=member.name,
         temp_password=temp_password,
-        family_name=family.name if family else "Your Family",
+        family_name=member.family.name if member.family else "Your Family",
         member_id=member.id,
     )
 
-    if not email_sent:
-        raise HTTPException(status_code=500, detail="Failed to send invitation email.")
+    db.commit()
+
+    # Send the email after the response; the new temporary password is already saved
+    background_tasks.add_task(crud_member.send_invitation_email_task, **invitation_email)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# The permission list is fixed per process, so its JSON body is built once at import
+_AVAILABLE_PERMISSIONS_JSON = orjson.dumps([perm.value for perm in AccessPermissionEnum])
 
 
 @router.get("/access/permissions", response_model=List[str])
 def list_available_permissions():
-    return [perm.value for perm in AccessPermissionEnum]
+    return Response(content=_AVAILABLE_PERMISSIONS_JSON, media_type="application/json")
 
 @router.get("/access/{member_id}", response_model=DelegatedAccessOut)
 def get_member_permissions(
@@ -317,8 +427,11 @@ def get_member_permissions(
     if not current_user.family_id:
         raise HTTPException(status_code=400, detail="No family assigned to user.")
 
-    member = db.query(FamilyMember).options(joinedload(FamilyMember.permissions)) \
-        .filter(FamilyMember.id == member_id, FamilyMember.family_id == current_user.family_id).first()
+    # A single member's few permissions: one joined round-trip over just the columns the response needs
+    member = db.query(FamilyMember).options(
+        load_only(FamilyMember.id, FamilyMember.name),
+        joinedload(FamilyMember.permissions).load_only(FamilyMemberPermission.permission),
+    ).filter(FamilyMember.id == member_id, FamilyMember.family_id == current_user.family_id).first()
 
     if not member:
         raise HTTPException(status_code=404, detail="Family member not found.")
@@ -330,87 +443,74 @@ def get_member_permissions(
     )
 
 
-@router.get("/{family_id}/stats", response_model=FamilyStats, tags=["Stats"])
-def get_family_stats(family_id: int, db: Session = Depends(get_db)):
+# AgeDistribution field -> inclusive age range in years (None: open-ended)
+_AGE_BUCKETS = {
+    "twenty_to_twenty_two": (20, 22),
+    "twenty_three_to_twenty_five": (23, 25),
+    "twenty_six_to_thirty": (26, 30),
+    "thirty_one_to_thirty_five": (31, 35),
+    "thirty_six_to_forty": (36, 40),
+    "forty_plus": (41, None),
+}
 
-    if not db.query(Family).filter(Family.id == family_id).first():
-        raise HTTPException(status_code=404, detail="Family not found")
 
+@router.get("/{family_id}/stats", response_model=FamilyStats, tags=["Stats"])
+@cached("family_stats", "family", ttl=120)
+async def get_family_stats(family_id: int, db: AsyncSession = Depends(get_async_db)):
     today = date.today()
-    current_year = today.year
-
-
-    total_members_count = db.query(User).filter(User.family_id == family_id).count()
-
     first_day_of_current_month = today.replace(day=1)
-    monthly_members_count = db.query(User).filter(
-        User.family_id == family_id,
-        User.created_at >= first_day_of_current_month
-    ).count()
-
-    bcc_graduate_count = db.query(FamilyMember).filter(
-        FamilyMember.family_id == family_id,
-        FamilyMember.year_of_graduation != None,
-        FamilyMember.year_of_graduation < current_year
-    ).count()
+    start_of_week = today - timedelta(days=today.weekday())
+    end_of_week = start_of_week + timedelta(days=6)
+    thirty_days_ago = today - timedelta(days=30)
 
     start_col = func.coalesce(Activity.start_date, Activity.date)
     end_col = func.coalesce(Activity.end_date, Activity.date)
 
-    active_events_count = db.query(Activity).filter(
-        Activity.family_id == family_id,
-        end_col >= today
-    ).count()
-
-    start_of_week = today - timedelta(days=today.weekday())
-    end_of_week = start_of_week + timedelta(days=6)
-    weekly_events_count = db.query(Activity).filter(
+    # Member, BCC graduate, age bucket and event counters in a single statement: each table is
+    # aggregated in a one-row subquery joined onto the family's row (no row means no family)
+    users = select(
+        func.count().label("total_members"),
+        func.count().filter(User.created_at >= first_day_of_current_month).label("monthly_members"),
+    ).where(User.family_id == family_id).subquery()
+
+    age = func.date_part("year", func.age(today, FamilyMember.date_of_birth))
+    members = select(
+        func.count().filter(FamilyMember.year_of_graduation < today.year).label("bcc_graduate"),
+        func.count(FamilyMember.date_of_birth).label("total_with_dob"),
+        *(
+            func.count().filter(age.between(low, high) if high is not None else age >= low).label(key)
+            for key, (low, high) in _AGE_BUCKETS.items()
+        ),
+    ).where(FamilyMember.family_id == family_id).subquery()
+
+    activities = select(
+        func.count().filter(end_col >= today).label("active_events"),
+        func.count().filter(end_col >= start_of_week, start_col <= end_of_week).label("weekly_events"),
+        func.count().filter(end_col >= thirty_days_ago).label("engagement"),
+    ).where(
         Activity.family_id == family_id,
-        and_(end_col >= start_of_week, start_col <= end_of_week)
-    ).count()
+        # Every counter above needs an end date within the last 30 days or later
+        end_col >= thirty_days_ago,
+    ).subquery()
+
+    totals = (await db.execute(
+        select(users, members, activities)
+        .select_from(Family)
+        .join(users, true())
+        .join(members, true())
+        .join(activities, true())
+        .where(Family.id == family_id)
+    )).mappings().first()
+    if totals is None:
+        raise HTTPException(status_code=404, detail="Family not found")
 
-    thirty_days_ago = today - timedelta(days=30)
-    engagement_count = db.query(Activity).filter(
-        Activity.family_id == family_id,
-        end_col >= thirty_days_ago
-    ).count()
-
-    # --- New: Age Distribution Calculation ---
-    members_with_dob = db.query(FamilyMember).filter(
-        FamilyMember.family_id == family_id,
-        FamilyMember.date_of_birth != None
-    ).all()
-
-    total_with_dob = len(members_with_dob)
-    age_counts = {"20-22": 0, "23-25": 0, "26-30": 0, "31-35": 0, "36-40": 0, "40+": 0}
-
-    if total_with_dob > 0:
-        for member in members_with_dob:
-            age = today.year - member.date_of_birth.year - (
-                        (today.month, today.day) < (member.date_of_birth.month, member.date_of_birth.day))
-            if 20 <= age <= 22:
-                age_counts["20-22"] += 1
-            elif 23 <= age <= 25:
-                age_counts["23-25"] += 1
-            elif 26 <= age <= 30:
-                age_counts["26-30"] += 1
-            elif 31 <= age <= 35:
-                age_counts["31-35"] += 1
-            elif 36 <= age <= 40:
-                age_counts["36-40"] += 1
-            elif age >= 41:
-                age_counts["40+"] += 1
-
-    age_distribution_data = AgeDistribution(
-        twenty_to_twenty_two=round((age_counts["20-22"] / total_with_dob * 100), 2) if total_with_dob > 0 else 0,
-        twenty_three_to_twenty_five=round((age_counts["23-25"] / total_with_dob * 100), 2) if total_with_dob > 0 else 0,
-        twenty_six_to_thirty=round((age_counts["26-30"] / total_with_dob * 100), 2) if total_with_dob > 0 else 0,
-        thirty_one_to_thirty_five=round((age_counts["31-35"] / total_with_dob * 100), 2) if total_with_dob > 0 else 0,
-        thirty_six_to_forty=round((age_counts["36-40"] / total_with_dob * 100), 2) if total_with_dob > 0 else 0,
-        forty_plus=round((age_counts["40+"] / total_with_dob * 100), 2) if total_with_dob > 0 else 0,
-    )
+    total_with_dob = totals["total_with_dob"]
+    age_distribution_data = AgeDistribution(**{
+        key: round(totals[key] / total_with_dob * 100, 2) if total_with_dob > 0 else 0
+        for key in _AGE_BUCKETS
+    })
 
-    # --- New: Activity Trends Calculation (Last 6 Months) ---
+    # --- Activity Trends (Last 6 Months), counted per start month and category in SQL ---
     trends = {}
     for i in range(6):
         # Go back month by month
@@ -419,39 +519,41 @@ def get_family_stats(family_id: int, db: Session = Depends(get_db)):
         if month <= 0:
             month += 12
             year -= 1
-        month_key = date(year, month, 1).strftime("%Y-%m")
-        trends[month_key] = {"spiritual": 0, "social": 0}
+        trends[f"{year:04d}-{month:02d}"] = {"spiritual": 0, "social": 0}
 
     six_months_ago_date = date(today.year, today.month, 1) - timedelta(days=31 * 5)  # Approximate start date
 
-    activities = db.query(Activity).filter(
-        Activity.family_id == family_id,
-        end_col >= six_months_ago_date.replace(day=1),
-        Activity.category.in_([ActivityCategoryEnum.spiritual, ActivityCategoryEnum.social])
-    ).all()
+    start_month = func.date_trunc("month", start_col)
+    trend_rows = (await db.execute(
+        select(start_month, Activity.category, func.count(Activity.id))
+        .where(
+            Activity.family_id == family_id,
+            end_col >= six_months_ago_date.replace(day=1),
+            Activity.category.in_([ActivityCategoryEnum.spiritual, ActivityCategoryEnum.social]),
+        )
+        .group_by(start_month, Activity.category)
+    )).all()
 
-    for act in activities:
-        month_key = (act.start_date or act.date).strftime("%Y-%m")
+    for month_start, category, count in trend_rows:
+        month_key = f"{month_start.year:04d}-{month_start.month:02d}"
         if month_key in trends:
-            if act.category == ActivityCategoryEnum.spiritual:
-                trends[month_key]["spiritual"] += 1
-            elif act.category == ActivityCategoryEnum.social:
-                trends[month_key]["social"] += 1
+            trends[month_key][category.name] += count
 
     activity_trends_data = {
         month: MonthlyTrend(**counts) for month, counts in trends.items()
     }
 
-    bcc_graduate_percentage = round((bcc_graduate_count / total_members_count) * 100, 1) if total_members_count > 0 else 0
+    total_members_count = totals["total_members"]
+    bcc_graduate_percentage = round((totals["bcc_graduate"] / total_members_count) * 100, 1) if total_members_count > 0 else 0
 
     return FamilyStats(
         total_members=total_members_count,
-        monthly_members=monthly_members_count,
-        bcc_graduate=bcc_graduate_count,
+        monthly_members=totals["monthly_members"],
+        bcc_graduate=totals["bcc_graduate"],
         bcc_graduate_percentage=bcc_graduate_percentage,
-        active_events=active_events_count,
-        weekly_events=weekly_events_count,
-        engagement=engagement_count,
+        active_events=totals["active_events"],
+        weekly_events=totals["weekly_events"],
+        engagement=totals["engagement"],
         age_distribution=age_distribution_data,
         activity_trends=activity_trends_data,
-    )
\ No newline at end of file
+    )
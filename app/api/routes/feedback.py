@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -34,10 +34,7 @@ def read_feedback_list(
     """
     Get all feedback, optionally filtered by status
     """
-    try:
-        return get_feedback_list(db, status)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching feedback: {str(e)}")
+    return get_feedback_list(db, status)
 
 @router.get("/new-count", response_model=int)
 def read_new_feedback_count(
@@ -47,10 +44,7 @@ def read_new_feedback_count(
     """
     Get count of new feedback items
     """
-    try:
-        return get_new_feedback_count(db)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching new feedback count: {str(e)}")
+    return get_new_feedback_count(db)
 
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
 def read_feedback(
@@ -61,12 +55,7 @@ def read_feedback(
     """
     Get a specific feedback item by ID
     """
-    try:
-        return get_feedback_by_id(db, feedback_id)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching feedback: {str(e)}")
+    return get_feedback_by_id(db, feedback_id)
 
 @router.post("/", response_model=FeedbackResponse)
 def create_new_feedback(
@@ -77,14 +66,9 @@ def create_new_feedback(
     """
     Create a new feedback item
     """
-    try:
-        # Set the author based on current user
-        feedback.author = current_user.full_name
-        return create_feedback(db, feedback)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating feedback: {str(e)}")
+    # Set the author based on current user
+    feedback.author = current_user.full_name
+    return create_feedback(db, feedback)
 
 @router.put("/{feedback_id}", response_model=FeedbackResponse)
 def update_existing_feedback(
@@ -96,12 +80,7 @@ def update_existing_feedback(
     """
     Update a feedback item - church pastor only
     """
-    try:
-        return update_feedback(db, feedback_id, feedback_update)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error updating feedback: {str(e)}")
+    return update_feedback(db, feedback_id, feedback_update)
 
 
 @router.post("/{feedback_id}/reply", response_model=ReplyResponse)
@@ -111,15 +90,10 @@ def create_feedback_reply(
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user)
 ):
-    try:
-        # Determine author display based on role
-        if current_user.role.value == RoleEnum.other:
-            author = f"Youth Member {current_user.full_name}"
-        else:
-            author = f"{current_user.role.value} {current_user.full_name}"
+    # Determine author display based on role
+    if current_user.role.value == RoleEnum.other:
+        author = f"Youth Member {current_user.full_name}"
+    else:
+        author = f"{current_user.role.value} {current_user.full_name}"
 
-        return create_reply(db, feedback_id, reply, author)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating reply: {str(e)}")
\ No newline at end of file
+    return create_reply(db, feedback_id, reply, author)
\ No newline at end of file
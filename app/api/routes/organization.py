@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 from app.schemas.user import RoleEnum
-from app.models.family_role import FamilyRole
+from app.controllers.family_role import get_family_role_name
 
 from app.controllers import organization as crud
 from app.schemas.organization import (
@@ -20,12 +21,17 @@ from app.schemas.organization import (
 
 router = APIRouter(tags=["Organization"])
 
+# Roles that pass the youth committee check outright
+_ADMIN_OR_PASTOR_ROLES = frozenset({RoleEnum.admin, RoleEnum.church_pastor})
+# Family role names (lower-cased) that make an "other" user a youth committee member
+_YOUTH_COMMITTEE_ROLE_NAMES = frozenset({"youth leader", "youth committee"})
+
 
 def require_youth_committee(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> User:
-    if current_user.role in {RoleEnum.admin, RoleEnum.church_pastor}:
+    if current_user.role in _ADMIN_OR_PASTOR_ROLES:
         return current_user
 
     if current_user.role != RoleEnum.other:
@@ -34,27 +40,23 @@ def require_youth_committee(
     if not current_user.family_role_id:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    family_role = (
-        db.query(FamilyRole)
-        .filter(FamilyRole.id == current_user.family_role_id)
-        .first()
-    )
-    if not family_role:
+    family_role_name = get_family_role_name(db, current_user.family_role_id)
+    if family_role_name is None:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    role_name = (family_role.name or "").strip().lower()
-    if role_name not in {"youth leader", "youth committee"}:
+    role_name = family_role_name.strip().lower()
+    if role_name not in _YOUTH_COMMITTEE_ROLE_NAMES:
         raise HTTPException(status_code=403, detail="Access denied")
 
     return current_user
 
 
 @router.get("/positions", response_model=list[OrganizationPositionOut])
-def list_positions(
-    db: Session = Depends(get_db),
+async def list_positions(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    return crud.list_positions(db)
+    return await crud.list_positions(db)
 
 
 @router.post("/positions", response_model=OrganizationPositionOut, status_code=status.HTTP_201_CREATED)
@@ -86,11 +88,11 @@ def delete_position(
 
 
 @router.get("/small-committees", response_model=list[SmallCommitteeOut])
-def list_small_committees(
-    db: Session = Depends(get_db),
+async def list_small_committees(
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    return crud.list_small_committees(db)
+    return await crud.list_small_committees(db)
 
 
 @router.post("/small-committees", response_model=SmallCommitteeOut, status_code=status.HTTP_201_CREATED)
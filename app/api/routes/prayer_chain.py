@@ -1,5 +1,5 @@
 # app/api/routes/prayer_chain.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -27,11 +27,8 @@ def read_prayer_chains(
         pastor_user: User = Depends(get_pastor_user)
 ):
     """Get all prayer chains with detailed family information - accessible only to church pastors"""
-    try:
-        prayer_chains = get_all_prayer_chains(db)
-        return prayer_chains
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching prayer chains: {str(e)}")
+    prayer_chains = get_all_prayer_chains(db)
+    return prayer_chains
 
 
 @router.get("/{prayer_chain_id}", response_model=PrayerChainResponse)
@@ -41,13 +38,8 @@ def read_prayer_chain(
         pastor_user: User = Depends(get_pastor_user)
 ):
     """Get a specific prayer chain by ID with detailed family information - accessible only to church pastors"""
-    try:
-        prayer_chain = get_prayer_chain_by_id(db, prayer_chain_id)
-        return prayer_chain
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching prayer chain: {str(e)}")
+    prayer_chain = get_prayer_chain_by_id(db, prayer_chain_id)
+    return prayer_chain
 
 
 @router.post("/", response_model=PrayerChainResponse)
@@ -63,12 +55,7 @@ def create_or_add_prayer_chain_schedules(
 
     Automatically handles collision detection for all schedules.
     """
-    try:
-        return create_or_update_prayer_chain(db, prayer_chain)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing prayer chain: {str(e)}")
+    return create_or_update_prayer_chain(db, prayer_chain)
 
 
 @router.delete("/{prayer_chain_id}")
@@ -78,12 +65,7 @@ def delete_existing_prayer_chain(
         pastor_user: User = Depends(get_pastor_user)
 ):
     """Delete a prayer chain and all its schedules - accessible only to church pastors"""
-    try:
-        return delete_prayer_chain(db, prayer_chain_id)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting prayer chain: {str(e)}")
+    return delete_prayer_chain(db, prayer_chain_id)
 
 
 @router.delete("/schedules/{schedule_id}")
@@ -93,9 +75,4 @@ def delete_existing_schedule(
         pastor_user: User = Depends(get_pastor_user)
 ):
     """Delete a specific schedule - accessible only to church pastors"""
-    try:
-        return delete_schedule(db, schedule_id)
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting schedule: {str(e)}")
\ No newline at end of file
+    return delete_schedule(db, schedule_id)
\ No newline at end of file
@@ -1,11 +1,10 @@
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.models.family_activity import Activity
-from app.models.family import Family
+from app.utils.http_cache import PUBLIC_REVALIDATE, etag_matches, not_modified_response, set_cache_headers
 from app.schemas.activity_checkin import (
     PublicCheckinInfo,
     ActivityAttendanceCreatePublic,
@@ -20,16 +19,11 @@ router = APIRouter(tags=["Public Check-in"])
 
 @router.get("/activity-checkin/{token}", response_model=PublicCheckinInfo)
 def get_public_checkin_info(token: str, db: Session = Depends(get_db)):
-    session = crud_checkin.get_checkin_session_by_token(db, token)
+    session = crud_checkin.get_checkin_session_by_token(db, token, with_activity=True)
     if not session or session.is_active is False:
         raise HTTPException(status_code=404, detail="Invalid or inactive check-in token")
 
-    activity = (
-        db.query(Activity)
-        .options(joinedload(Activity.family))
-        .filter(Activity.id == session.activity_id)
-        .first()
-    )
+    activity = session.activity
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -71,11 +65,11 @@ def public_submit_attendance(
     payload: ActivityAttendanceCreatePublic,
     db: Session = Depends(get_db),
 ):
-    session = crud_checkin.get_checkin_session_by_token(db, token)
+    session = crud_checkin.get_checkin_session_by_token(db, token, with_activity=True)
     if not session or session.is_active is False:
         raise HTTPException(status_code=404, detail="Invalid or inactive check-in token")
 
-    activity = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.id == session.activity_id).first()
+    activity = session.activity
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -88,7 +82,7 @@ def public_submit_attendance(
         raise HTTPException(status_code=400, detail="Check-in is closed")
 
     try:
-        attendance = crud_checkin.create_attendance(
+        attendance, family_name = crud_checkin.create_attendance(
             db,
             activity_id=activity.id,
             attendee_name=payload.attendee_name,
@@ -97,11 +91,6 @@ def public_submit_attendance(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    family_name = None
-    if attendance.family_of_origin_id:
-        fam = db.query(Family).filter(Family.id == attendance.family_of_origin_id).first()
-        family_name = fam.name if fam else None
-
     return ActivityAttendanceOut(
         id=attendance.id,
         activity_id=attendance.activity_id,
@@ -113,6 +102,11 @@ def public_submit_attendance(
 
 
 @router.get("/families", response_model=list[FamilyPublicOut])
-def list_families_public(db: Session = Depends(get_db)):
-    families = db.query(Family).order_by(Family.category.asc(), Family.name.asc()).all()
-    return [FamilyPublicOut(id=f.id, name=f.name, category=f.category) for f in families]
+def list_families_public(request: Request, db: Session = Depends(get_db)):
+    body, etag = crud_checkin.get_public_families_json(db)
+    if etag_matches(request, etag):
+        return not_modified_response(etag, cache_control=PUBLIC_REVALIDATE)
+
+    response = Response(content=body, media_type="application/json")
+    set_cache_headers(response, etag, cache_control=PUBLIC_REVALIDATE)
+    return response
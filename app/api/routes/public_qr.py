@@ -1,7 +1,7 @@
+import functools
 from io import BytesIO
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -11,19 +11,14 @@ import app.controllers.activity_checkin as crud_checkin
 router = APIRouter(tags=["Public QR"])
 
 
-@router.get("/checkin-qr/{token}")
-def get_checkin_qr_png(token: str, db: Session = Depends(get_db)):
-    session = crud_checkin.get_checkin_session_by_token(db, token)
-    if not session or session.is_active is False:
-        raise HTTPException(status_code=404, detail="Invalid or inactive check-in token")
-
+@functools.lru_cache(maxsize=1024)
+def _render_qr_png(url: str) -> bytes:
+    """PNG bytes of the QR code for a check-in URL; a token's URL never changes, so renders are reused"""
     try:
         import qrcode
     except Exception:
         raise HTTPException(status_code=500, detail="QR code generator not installed")
 
-    url = crud_checkin.build_checkin_url(token)
-
     try:
         qr = qrcode.QRCode(
             version=None,
@@ -33,8 +28,8 @@ def get_checkin_qr_png(token: str, db: Session = Depends(get_db)):
         )
         qr.add_data(url)
         qr.make(fit=True)
+        # Black-and-white image kept 1-bit: smaller PNG, no RGB conversion
         img = qr.make_image(fill_color="black", back_color="white")
-        img = img.convert("RGB")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate QR code: {e}")
 
@@ -43,10 +38,15 @@ def get_checkin_qr_png(token: str, db: Session = Depends(get_db)):
         img.save(buf, format="PNG")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to encode QR PNG: {e}")
-    buf.seek(0)
+    return buf.getvalue()
+
+
+@router.get("/checkin-qr/{token}")
+def get_checkin_qr_png(token: str, db: Session = Depends(get_db)):
+    session = crud_checkin.get_checkin_session_by_token(db, token)
+    if not session or session.is_active is False:
+        raise HTTPException(status_code=404, detail="Invalid or inactive check-in token")
 
-    return StreamingResponse(
-        buf,
-        media_type="image/png",
-        headers={"Cache-Control": "no-store"},
-    )
+    # Rendering is cached in-process, but clients must not keep a QR once its session is deactivated
+    png = _render_qr_png(crud_checkin.build_checkin_url(token))
+    return Response(content=png, media_type="image/png", headers={"Cache-Control": "no-store"})
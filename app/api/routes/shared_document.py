@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form, Query, HTTPException
-from sqlalchemy import or_
+from sqlalchemy import distinct, or_
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -142,8 +142,6 @@ async def get_document_types_route(
         db: Session = Depends(get_db)
 ):
     """Get list of available document types/MIME types"""
-    from sqlalchemy import func, distinct
-
     query = db.query(distinct(SharedDocument.mime_type)).filter(
         SharedDocument.mime_type.isnot(None)
     )
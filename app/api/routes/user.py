@@ -9,7 +9,7 @@ from app.core.security import get_current_active_user, get_current_user
 from app.core.security import get_password_hash
 from app.models.user import User
 from app.schemas.user import RoleEnum
-from app.services.email_service import EmailService
+from app.services.email_service import email_service
 from app.services.profile_upload import profile_upload_service
 from app.utils.timestamps import (
     parse_timestamp_filters,
@@ -36,7 +36,6 @@ def create_user(
         raise HTTPException(status_code=400, detail="Email already exists")
 
     try:
-        email_service = EmailService()
         temp_password: str | None = None
 
         # If admin didn't provide a password, create a secure temporary password
@@ -169,7 +168,6 @@ def admin_reset_user_password(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    email_service = EmailService()
     temp_password = email_service.generate_temporary_password()
 
     # Set the new password immediately (user can still change it via activation link)
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 from datetime import datetime, time, timedelta, timezone
 import secrets
+import threading
 from typing import Optional
 
-from sqlalchemy.orm import Session, joinedload
+import orjson
+from cachetools import TTLCache
+from sqlalchemy import Text, cast, event, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
 
 from app.core.config import settings
 from app.models.family_activity import Activity
 from app.models.family_activity_checkin import ActivityCheckinSession, ActivityAttendance
 from app.models.family import Family
+from app.utils.http_cache import build_etag
 
 
 def _generate_unique_token(db: Session) -> str:
@@ -87,17 +93,17 @@ def get_activity_by_checkin_token(db: Session, token: str) -> Optional[Activity]
     if not session:
         return None
 
-    activity = (
-        db.query(Activity)
-        .options(joinedload(Activity.family))
-        .filter(Activity.id == session.activity_id)
-        .first()
-    )
-    return activity
+    return db.get(Activity, session.activity_id, options=[joinedload(Activity.family)])
 
 
-def get_checkin_session_by_token(db: Session, token: str) -> Optional[ActivityCheckinSession]:
-    return db.query(ActivityCheckinSession).filter(ActivityCheckinSession.token == token).first()
+def get_checkin_session_by_token(
+    db: Session, token: str, with_activity: bool = False
+) -> Optional[ActivityCheckinSession]:
+    query = db.query(ActivityCheckinSession)
+    if with_activity:
+        # Session, activity and family in one round-trip for the public check-in pages
+        query = query.options(joinedload(ActivityCheckinSession.activity).joinedload(Activity.family))
+    return query.filter(ActivityCheckinSession.token == token).first()
 
 
 def create_attendance(
@@ -106,14 +112,16 @@ def create_attendance(
     activity_id: int,
     attendee_name: str,
     family_of_origin_id: Optional[int],
-) -> ActivityAttendance:
+) -> tuple[ActivityAttendance, Optional[str]]:
     attendee_name = attendee_name.strip()
     if not attendee_name:
         raise ValueError("Attendee name is required")
 
+    # The name doubles as the existence check and is returned for the response
+    family_name = None
     if family_of_origin_id is not None:
-        family = db.query(Family).filter(Family.id == family_of_origin_id).first()
-        if not family:
+        family_name = db.query(Family.name).filter(Family.id == family_of_origin_id).scalar()
+        if family_name is None:
             raise ValueError("Family of origin not found")
 
     attendance = ActivityAttendance(
@@ -124,14 +132,70 @@ def create_attendance(
     db.add(attendance)
     db.commit()
     db.refresh(attendance)
-    return attendance
+    return attendance, family_name
 
 
 def list_attendances_for_activity(db: Session, activity_id: int) -> list[ActivityAttendance]:
     return (
         db.query(ActivityAttendance)
-        .options(joinedload(ActivityAttendance.family_of_origin))
+        .options(
+            # Few distinct families per activity: one IN query instead of repeating family columns per row.
+            # raiseload guards against any other lazy load sneaking into the listing.
+            selectinload(ActivityAttendance.family_of_origin),
+            raiseload("*"),
+        )
         .filter(ActivityAttendance.activity_id == activity_id)
         .order_by(ActivityAttendance.created_at.asc())
         .all()
     )
+
+
+# Per-process copy of the public families list as (JSON body, ETag). Families change rarely;
+# ORM writes to them clear it, and the TTL bounds staleness from other processes.
+_public_families_cache = TTLCache(maxsize=1, ttl=max(settings.PUBLIC_FAMILIES_CACHE_TTL_SECONDS, 1))
+_public_families_lock = threading.Lock()
+
+
+@event.listens_for(Family, "after_insert")
+@event.listens_for(Family, "after_update")
+@event.listens_for(Family, "after_delete")
+def _forget_public_families(mapper, connection, target: Family) -> None:
+    with _public_families_lock:
+        _public_families_cache.clear()
+
+
+def _public_families_pg_json(db: Session) -> bytes:
+    # Postgres builds the JSON array itself; cast to text so the driver hands back the raw document
+    families_json = func.json_agg(
+        aggregate_order_by(
+            func.json_build_object("id", Family.id, "name", Family.name, "category", Family.category),
+            Family.category.asc(),
+            Family.name.asc(),
+        )
+    )
+    return db.execute(select(func.coalesce(cast(families_json, Text), "[]"))).scalar_one().encode("utf-8")
+
+
+def _public_families_orm_json(db: Session) -> bytes:
+    rows = (
+        db.query(Family.id, Family.name, Family.category)
+        .order_by(Family.category.asc(), Family.name.asc())
+        .all()
+    )
+    return orjson.dumps([{"id": id_, "name": name, "category": category} for id_, name, category in rows])
+
+
+def get_public_families_json(db: Session) -> tuple[bytes, str]:
+    """JSON body and ETag of the public families list (id, name, category by category then name)"""
+    if settings.PUBLIC_FAMILIES_CACHE_TTL_SECONDS > 0:
+        with _public_families_lock:
+            cached = _public_families_cache.get("families")
+        if cached is not None:
+            return cached
+
+    body = _public_families_pg_json(db) if db.get_bind().dialect.name == "postgresql" else _public_families_orm_json(db)
+    result = (body, build_etag(body))
+    if settings.PUBLIC_FAMILIES_CACHE_TTL_SECONDS > 0:
+        with _public_families_lock:
+            _public_families_cache["families"] = result
+    return result
@@ -1,6 +1,8 @@
-from typing import Any, List
+from typing import Any, Dict, Iterable, List
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session, joinedload
 from app.models.family_activity import Activity
+from app.models.family import Family
 from app.schemas.family_activity import ActivityCreate, ActivityOut
 from app.utils.logging_decorator import log_create, log_view
 
@@ -38,7 +40,7 @@ def _activity_to_dict(activity: Activity) -> dict:
 
 @log_create("family_activities", "Created new family activity")
 def create_activity(db: Session, activity: ActivityCreate):
-    db_activity = Activity(**activity.dict())
+    db_activity = Activity(**activity.model_dump())
     db.add(db_activity)
     db.commit()
     db.refresh(db_activity)
@@ -49,8 +51,7 @@ def create_activity(db: Session, activity: ActivityCreate):
     upsert_checkin_session(db, db_activity)
 
     # Get the activity with family relationship loaded
-    activity_with_family = db.query(Activity).options(joinedload(Activity.family)).filter(
-        Activity.id == db_activity.id).first()
+    activity_with_family = db.get(Activity, db_activity.id, options=[joinedload(Activity.family)])
 
     # Convert to Pydantic model with family_name populated
     activity_dict = _activity_to_dict(activity_with_family)
@@ -65,7 +66,7 @@ def get_activities_by_family(db: Session, family_id: int) -> List[ActivityOut]:
 
 @log_view("family_activities", "Viewed activity details")
 def get_activity_by_id(db: Session, activity_id: int) -> ActivityOut | None:
-    activity = db.query(Activity).options(joinedload(Activity.family)).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id, options=[joinedload(Activity.family)])
 
     if not activity:
         return None
@@ -75,11 +76,64 @@ def get_activity_by_id(db: Session, activity_id: int) -> ActivityOut | None:
     return ActivityOut(**activity_dict)
 
 
-def convert_activities_to_out(activities: List[Activity]) -> List[ActivityOut]:
-    """Helper function to convert SQLAlchemy models to Pydantic models with family_name"""
+# Columns serialised by ActivityOut, selected directly by the bulk list endpoints
+ACTIVITY_OUT_COLUMNS = (
+    Activity.id,
+    Activity.family_id,
+    Activity.date,
+    Activity.start_date,
+    Activity.end_date,
+    Activity.start_time,
+    Activity.end_time,
+    Activity.status,
+    Activity.category,
+    Activity.type,
+    Activity.description,
+    Activity.location,
+    Activity.platform,
+    Activity.days,
+    Activity.preachers,
+    Activity.speakers,
+    Activity.budget,
+    Activity.logistics,
+    Activity.is_recurring_monthly,
+    Activity.created_at,
+    Activity.updated_at,
+)
+
+
+def select_activity_rows() -> Select:
+    """Core SELECT of the ActivityOut columns, skipping ORM hydration for list reads"""
+    return select(*ACTIVITY_OUT_COLUMNS)
+
+
+def get_family_names(db: Session, family_ids: Iterable[int]) -> Dict[int, str]:
+    """Look up the family names for a page of activities with a single IN query"""
+    family_ids = set(family_ids)
+    if not family_ids:
+        return {}
+    return dict(db.query(Family.id, Family.name).filter(Family.id.in_(family_ids)).all())
+
+
+def convert_rows_to_out(rows: List[dict], family_names: Dict[int, str]) -> List[ActivityOut]:
+    """
+    Build ActivityOut models from select_activity_rows() mappings.
+    DB-typed values are trusted, so model_construct skips validation.
+    """
     result = []
-    for activity in activities:
-        activity_dict = _activity_to_dict(activity)
-        result.append(ActivityOut(**activity_dict))
-    
-    return result
\ No newline at end of file
+    for row in rows:
+        data = dict(row, family_name=family_names.get(row["family_id"], "Unknown"))
+        if data["is_recurring_monthly"] is not None:
+            data["is_recurring_monthly"] = bool(data["is_recurring_monthly"])
+        result.append(ActivityOut.model_construct(**data))
+    return result
+
+
+def convert_activities_to_out(activities: List[Activity]) -> List[ActivityOut]:
+    """
+    Helper function to convert SQLAlchemy models to Pydantic models with family_name.
+
+    Values come straight from typed DB columns, so the models are built with
+    model_construct to skip re-validating every row of a page.
+    """
+    return [ActivityOut.model_construct(**_activity_to_dict(activity)) for activity in activities]
@@ -1,7 +1,18 @@
+import hashlib
 import os
+import threading
 import uuid
 import json
+
+import aiofiles
+from cachetools import TTLCache
+from sqlalchemy import Select, column, func, select, table, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.session import engine
 from app.models.family_document import FamilyDocument
 from app.schemas.family_document import DocumentType, ReportStatus, LetterStatus
 from datetime import datetime
@@ -9,9 +20,18 @@ from fastapi import UploadFile, HTTPException
 from app.utils.logging_decorator import log_upload, log_view, log_delete
 
 UPLOAD_DIR = "uploads/documents"
+# Uploads are streamed to disk in chunks so large files never sit fully in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB for family documents
+# Statuses a document of each type may be moved to (mirrored by ck_family_documents_type_status)
+DOCUMENT_STATUSES = {
+    DocumentType.report: frozenset(s.value for s in ReportStatus),
+    DocumentType.letter: frozenset(s.value for s in LetterStatus),
+}
 
 
-def save_document_to_disk(family_id: int, file: UploadFile, type: DocumentType) -> tuple[str, str]:
+async def save_document_to_disk(family_id: int, file: UploadFile, type: DocumentType) -> tuple[str, str, str]:
+    """Stream an upload to disk, returning its path, file name and hex SHA-256"""
     ext = file.filename.split(".")[-1]
     file_id = str(uuid.uuid4())
     filename = f"{file_id}_{type}.{ext}"
@@ -19,17 +39,38 @@ def save_document_to_disk(family_id: int, file: UploadFile, type: DocumentType)
     os.makedirs(family_dir, exist_ok=True)
     file_path = os.path.join(family_dir, filename)
 
-    with open(file_path, "wb") as f:
-        f.write(file.file.read())
+    # Reject oversized uploads up front when the size is known, otherwise while streaming
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
+        )
+
+    written = 0
+    digest = hashlib.sha256()
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > MAX_FILE_SIZE:
+                break
+            digest.update(chunk)
+            await f.write(chunk)
 
-    return file_path, filename
+    if written > MAX_FILE_SIZE:
+        os.remove(file_path)
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
+        )
+
+    return file_path, filename, digest.hexdigest()
 
 
 @log_upload("family_documents", "Uploaded family document")
 def upload_family_document(
-        db: Session, family_id: int, type: DocumentType, file: UploadFile
+        db: Session, family_id: int, type: DocumentType, file: UploadFile, file_path: str, sha256: str | None = None
 ) -> FamilyDocument:
-    file_path, filename = save_document_to_disk(family_id, file, type)
+    """Record a document already written to disk by save_document_to_disk"""
     if type == DocumentType.report:
         status = ReportStatus.pending.value
     elif type == DocumentType.letter:
@@ -40,6 +81,7 @@ def upload_family_document(
     db_doc = FamilyDocument(
         family_id=family_id,
         file_path=file_path,
+        sha256=sha256,
         type=type.value,
         original_filename=file.filename,
         uploaded_at=datetime.utcnow(),
@@ -104,8 +146,8 @@ def create_rich_text_letter(
 @log_view("family_documents", "Viewed family document")
 def get_document_by_id(db: Session, doc_id: int, family_id: int) -> FamilyDocument:
     """Get document by ID for a specific family (regular user access)"""
-    doc = db.query(FamilyDocument).filter_by(id=doc_id, family_id=family_id).first()
-    if not doc:
+    doc = db.get(FamilyDocument, doc_id)
+    if not doc or doc.family_id != family_id:
         raise HTTPException(status_code=404, detail="Document not found")
     if doc.storage_type == "file":
         if not doc.file_path or not os.path.exists(doc.file_path):
@@ -116,7 +158,7 @@ def get_document_by_id(db: Session, doc_id: int, family_id: int) -> FamilyDocume
 @log_view("family_documents", "Admin viewed family document")
 def get_admin_document_by_id(db: Session, doc_id: int) -> FamilyDocument:
     """Get document by ID across all families (admin access only)"""
-    doc = db.query(FamilyDocument).filter_by(id=doc_id).first()
+    doc = db.get(FamilyDocument, doc_id)
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     if doc.storage_type == "file":
@@ -125,6 +167,43 @@ def get_admin_document_by_id(db: Session, doc_id: int) -> FamilyDocument:
     return doc
 
 
+def update_document_status(db: Session, doc_id: int, status: str, family_id: int) -> str:
+    """Set the status of one of a family's documents (regular user access)"""
+    return _set_document_status(db, doc_id, status, family_id=family_id, admin=False)
+
+
+def admin_update_document_status(db: Session, doc_id: int, status: str) -> str:
+    """Set the status of any family's document (admin access only)"""
+    return _set_document_status(db, doc_id, status, family_id=None, admin=True)
+
+
+def _set_document_status(db: Session, doc_id: int, status: str, family_id: int | None, admin: bool) -> str:
+    """
+    Set a document's status in one UPDATE ... RETURNING. The WHERE clause only matches document
+    types accepting the status, and the ck_family_documents_type_status constraint backs it up where
+    it is installed; when nothing matches, the document is read again for the exact error.
+    Unless admin is set, the update is restricted to family_id's documents.
+    """
+    valid_types = [doc_type for doc_type, statuses in DOCUMENT_STATUSES.items() if status in statuses]
+    stmt = update(FamilyDocument).where(FamilyDocument.id == doc_id, FamilyDocument.type.in_(valid_types))
+    if not admin:
+        stmt = stmt.where(FamilyDocument.family_id == family_id)
+    try:
+        row = db.execute(
+            stmt.values(status=status).returning(FamilyDocument.status, FamilyDocument.storage_type, FamilyDocument.file_path)
+        ).first()
+    except IntegrityError:
+        row = None
+
+    file_missing = row is not None and row.storage_type == "file" and not (row.file_path and os.path.exists(row.file_path))
+    if row is None or file_missing:
+        db.rollback()
+        doc = get_admin_document_by_id(db, doc_id) if admin else get_document_by_id(db, doc_id, family_id)
+        raise HTTPException(status_code=400, detail=f"Invalid status for {doc.type.value}")
+    db.commit()
+    return row.status
+
+
 @log_delete("family_documents", "Deleted family document")
 def delete_document(db: Session, doc: FamilyDocument):
     """Delete document (works for both regular users and admins)"""
@@ -156,4 +235,85 @@ def get_document_count_by_family(db: Session, family_id: int) -> int:
 
 def get_global_document_count(db: Session) -> int:
     """Get total document count across all families (admin only)"""
-    return db.query(FamilyDocument).count()
\ No newline at end of file
+    return db.query(FamilyDocument).count()
+
+
+# ---- Document statistics ----
+# Per-family counters are precomputed in a Postgres materialized view and refreshed after
+# document writes; other databases aggregate the same SELECT on the fly.
+
+DOCUMENT_STATS_VIEW = "mv_family_document_stats"
+DOCUMENT_STATS_COUNTERS = ("total", "reports", "letters", "pending", "approved", "reviewed", "submitted")
+
+document_stats = table(DOCUMENT_STATS_VIEW, column("family_id"), *(column(name) for name in DOCUMENT_STATS_COUNTERS))
+
+# Short-lived per-process cache of computed counters, keyed by family_id (None for the global sums).
+# Cleared after every view refresh, which runs in the threadpool, hence the lock.
+_stats_cache = TTLCache(maxsize=1024, ttl=max(settings.DOCUMENT_STATS_CACHE_TTL_SECONDS, 1))
+_stats_cache_lock = threading.Lock()
+
+
+def document_stats_select() -> Select:
+    """Per-family document counters; the definition of the materialized view"""
+    count = func.count(FamilyDocument.id)
+    return select(
+        FamilyDocument.family_id,
+        count.label("total"),
+        count.filter(FamilyDocument.type == DocumentType.report).label("reports"),
+        count.filter(FamilyDocument.type == DocumentType.letter).label("letters"),
+        count.filter(FamilyDocument.status == "pending").label("pending"),
+        count.filter(FamilyDocument.status == "approved").label("approved"),
+        count.filter(FamilyDocument.status == "reviewed").label("reviewed"),
+        count.filter(FamilyDocument.status == "submitted").label("submitted"),
+    ).group_by(FamilyDocument.family_id)
+
+
+def _uses_stats_view(db: Session | AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def document_stats_source(db: Session | AsyncSession):
+    """The materialized view on Postgres, otherwise a live aggregate with the same columns"""
+    return document_stats if _uses_stats_view(db) else document_stats_select().subquery()
+
+
+def create_document_stats_view(conn) -> None:
+    """Create the stats view (and the unique index REFRESH ... CONCURRENTLY needs) if missing"""
+    definition = document_stats_select().compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    conn.execute(text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {DOCUMENT_STATS_VIEW} AS {definition}"))
+    conn.execute(text(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{DOCUMENT_STATS_VIEW}_family_id ON {DOCUMENT_STATS_VIEW} (family_id)"
+    ))
+
+
+def refresh_document_stats() -> None:
+    """Recompute the stats view without blocking readers and drop cached counters; run after document writes"""
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {DOCUMENT_STATS_VIEW}"))
+    with _stats_cache_lock:
+        _stats_cache.clear()
+
+
+async def get_document_stats(db: AsyncSession, family_id: int | None = None) -> dict:
+    """Document counters for one family, or summed over every family when family_id is None"""
+    if settings.DOCUMENT_STATS_CACHE_TTL_SECONDS > 0:
+        with _stats_cache_lock:
+            stats = _stats_cache.get(family_id)
+        if stats is not None:
+            return stats
+
+    source = document_stats_source(db)
+    if family_id is not None:
+        row = (await db.execute(
+            select(*(source.c[name] for name in DOCUMENT_STATS_COUNTERS)).where(source.c.family_id == family_id)
+        )).mappings().first()
+    else:
+        row = (await db.execute(
+            select(*(func.coalesce(func.sum(source.c[name]), 0).label(name) for name in DOCUMENT_STATS_COUNTERS))
+        )).mappings().one()
+    stats = {name: int(row[name]) if row else 0 for name in DOCUMENT_STATS_COUNTERS}
+    if settings.DOCUMENT_STATS_CACHE_TTL_SECONDS > 0:
+        with _stats_cache_lock:
+            _stats_cache[family_id] = stats
+    return stats
@@ -1,22 +1,27 @@
 from datetime import datetime
 import logging
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
 
-from app.core.security import get_password_hash
+from app.core.security import get_temp_password_hash, get_temp_password_hashes
+from app.db.loading import lazy_load_guard
 from app.models import Family
 from app.models.family_member import FamilyMember, FamilyMemberPermission, FamilyMemberInvitation
 from app.models.user import User
 from app.schemas.family_member import FamilyMemberUpdate, GrantAccessRequest, DelegatedAccessOut
 
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 from sqlalchemy.orm import Session
 from app.models.family_member import FamilyMember
 from app.schemas.family_member import FamilyMemberCreate
 from app.schemas.user import RoleEnum, UserCreate
-from app.services.email_service import EmailService
+from app.services.email_service import email_service
 from app.controllers.user import create_user, update_user_password
 from app.utils.logging_decorator import log_create, log_update, log_delete, log_view
+from app.utils.timestamps import apply_timestamp_sorting
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +37,7 @@ def _enum_value(value):
 
 
 @log_create("family_members", "Created new family member")
-def create_family_member(db: Session, member: FamilyMemberCreate) -> FamilyMember:
+def create_family_member(db: Session, member: FamilyMemberCreate, background_tasks: BackgroundTasks) -> FamilyMember:
     existing_name = db.query(FamilyMember).filter(
         FamilyMember.name == member.name,
         FamilyMember.family_id == member.family_id
@@ -67,23 +72,23 @@ def create_family_member(db: Session, member: FamilyMemberCreate) -> FamilyMembe
     db.refresh(db_member)
 
     if member.email:
-        email_service = EmailService()
         temp_password = email_service.generate_temporary_password()
 
         # Get family info for email
-        family = db.query(Family).filter(Family.id == member.family_id).first()
+        family = db.get(Family, member.family_id)
         family_name = family.name if family else "Your Family"
 
         # Create invitation record
         invitation = FamilyMemberInvitation(
             member_id=db_member.id,
-            temp_password=get_password_hash(temp_password)  # Store hashed version
+            temp_password=get_temp_password_hash(temp_password)  # Store hashed version
         )
         db.add(invitation)
         db.commit()
 
-        # Send email
-        email_sent = email_service.send_invitation_email(
+        # Send the email after the response; the invitation is already saved
+        background_tasks.add_task(
+            send_invitation_email_task,
             to_email=member.email,
             member_name=member.name,
             temp_password=temp_password,
@@ -91,29 +96,158 @@ def create_family_member(db: Session, member: FamilyMemberCreate) -> FamilyMembe
             member_id=db_member.id,
         )
 
-        if not email_sent:
-            # Optionally, you might want to handle email failure
-            logger.warning(f"Failed to send invitation email to {member.email}")
-
     return db_member
 
 
+def send_invitation_email_task(**invitation_email) -> None:
+    """Background task for invitation emails; the invitation is already committed, so failures are only logged"""
+    if not email_service.send_invitation_email(**invitation_email):
+        logger.warning(f"Failed to send invitation email to {invitation_email['to_email']}")
+
+
+def send_invitation_emails_task(invitations: list[dict]) -> None:
+    """Background task for a batch of invitation emails, sent one after another over this thread's SMTP session"""
+    for invitation_email in invitations:
+        send_invitation_email_task(**invitation_email)
+
+
+
+def _filtered_members(family_id: int, filters: dict[str, datetime | None]) -> Select:
+    """
+    A family's members within the given timestamp bounds. Only the bounds that are set become
+    predicates: asyncpg prepares statements server-side, and a generic plan for an
+    `:bound IS NULL OR column >= :bound` form could not use the (family_id, timestamp) indexes.
+    """
+    stmt = select(FamilyMember).options(*lazy_load_guard()).where(FamilyMember.family_id == family_id)
+    if filters.get("created_after") is not None:
+        stmt = stmt.where(FamilyMember.created_at >= filters["created_after"])
+    if filters.get("created_before") is not None:
+        stmt = stmt.where(FamilyMember.created_at <= filters["created_before"])
+    if filters.get("updated_after") is not None:
+        stmt = stmt.where(FamilyMember.updated_at >= filters["updated_after"])
+    if filters.get("updated_before") is not None:
+        stmt = stmt.where(FamilyMember.updated_at <= filters["updated_before"])
+    return stmt
+
 
-@log_view("family_members", "Viewed family members")
-def get_family_members_by_family_id(db: Session, family_id: int) -> list[type[FamilyMember]]:
-    return db.query(FamilyMember).filter(FamilyMember.family_id == family_id).all()
+async def get_family_members_page(
+    db: AsyncSession,
+    family_id: int,
+    filters: dict[str, datetime | None],
+    after_id: int | None,
+    limit: int,
+) -> list[FamilyMember]:
+    """
+    One page of a family's members with ids above after_id. One extra row is fetched
+    so callers can tell whether another page follows.
+    """
+    stmt = (
+        _filtered_members(family_id, filters)
+        .where(FamilyMember.id > (after_id or 0))
+        .order_by(FamilyMember.id)
+        .limit(limit + 1)
+    )
+    return (await db.scalars(stmt)).all()
+
+
+async def get_family_members_sorted_page(
+    db: AsyncSession,
+    family_id: int,
+    filters: dict[str, datetime | None],
+    sort_by: str,
+    sort_order: str | None,
+    after: tuple[datetime, int] | None,
+    limit: int,
+) -> list[FamilyMember]:
+    """
+    One page of a family's members ordered by a timestamp (ties broken by id), seeking past
+    the (timestamp, id) of the previous page's last member. One extra row is fetched so
+    callers can tell whether another page follows.
+    """
+    column = FamilyMember.updated_at if sort_by == "updated_at" else FamilyMember.created_at
+    stmt = apply_timestamp_sorting(_filtered_members(family_id, filters), FamilyMember, sort_by, sort_order)
+    ascending = (sort_order or "desc").lower() == "asc"
+    stmt = stmt.order_by(FamilyMember.id.asc() if ascending else FamilyMember.id.desc())
+    if after is not None:
+        key, bound = tuple_(column, FamilyMember.id), tuple_(*after)
+        stmt = stmt.where(key > bound if ascending else key < bound)
+    stmt = stmt.limit(limit + 1)
+    return (await db.scalars(stmt)).all()
 
 
 @log_view("family_members", "Viewed family member details")
 def get_family_member_by_id(db: Session, member_id: int) -> FamilyMember | None:
-    return db.query(FamilyMember).filter(FamilyMember.id == member_id).first()
+    return _member_query(db, eager=True).filter(FamilyMember.id == member_id).first()
+
+
+def get_family_member_base(db: Session, member_id: int) -> FamilyMember | None:
+    """Load a member's own columns only, for callers that never touch its relationships"""
+    return _member_query(db, eager=False).filter(FamilyMember.id == member_id).first()
+
+
+@log_view("family_members", "Viewed family member details")
+def get_family_member_scoped(
+    db: Session,
+    member_id: int,
+    family_id: int | None,
+    with_family: bool = False,
+    with_invitation: bool = False,
+) -> FamilyMember | None:
+    """
+    Load a member only when it belongs to family_id, so rows of other families are never
+    fetched; a missing family_id matches nothing. with_family / with_invitation join the
+    family's name and the invitation's activation flag into the same SELECT.
+    """
+    query = _member_query(db, eager=False)
+    if with_family:
+        query = query.options(joinedload(FamilyMember.family).load_only(Family.name))
+    if with_invitation:
+        query = query.options(
+            joinedload(FamilyMember.invitation).load_only(FamilyMemberInvitation.is_activated)
+        )
+    return query.filter(
+        FamilyMember.id == member_id,
+        FamilyMember.family_id == family_id,
+    ).first()
+
+
+def upsert_member_invitations(db: Session, temp_passwords: dict[int, str]) -> None:
+    """
+    Store new hashed temporary passwords keyed by member id, creating or updating each
+    member's invitation in a single INSERT ... ON CONFLICT statement (not committed).
+    """
+    hashed = get_temp_password_hashes(temp_passwords.values())
+    stmt = pg_insert(FamilyMemberInvitation).values([
+        {"member_id": member_id, "temp_password": password_hash}
+        for member_id, password_hash in zip(temp_passwords, hashed)
+    ])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[FamilyMemberInvitation.member_id],
+        set_={"temp_password": stmt.excluded.temp_password},
+    ))
+
+
+def get_family_members_with_invitations(db: Session, member_ids: list[int], family_id: int | None) -> list[FamilyMember]:
+    """Load the given members of family_id with their invitations in one IN query (plus the selectin)"""
+    return (
+        db.query(FamilyMember)
+        .options(selectinload(FamilyMember.invitation), raiseload("*"))
+        .filter(FamilyMember.id.in_(member_ids), FamilyMember.family_id == family_id)
+        .all()
+    )
+
+
+def _member_query(db: Session, eager: bool):
+    # Invitation and permissions are loaded up front when eager; any other relationship access raises
+    options = [selectinload(FamilyMember.invitation), selectinload(FamilyMember.permissions)] if eager else []
+    return db.query(FamilyMember).options(*options, raiseload("*"))
 
 
 @log_update("family_members", "Updated family member")
 def update_family_member(
     db: Session, member_id: int, updates: FamilyMemberUpdate
 ) -> FamilyMember | None:
-    db_member = get_family_member_by_id(db, member_id)
+    db_member = get_family_member_base(db, member_id)
     if not db_member:
         return None
 
@@ -208,8 +342,11 @@ def grant_permissions_to_member(
 
 @log_view("family_member_permissions", "Viewed members with permissions")
 def get_members_with_permissions(db: Session, family_id: int) -> list[DelegatedAccessOut]:
-    members = db.query(FamilyMember).options(joinedload(FamilyMember.permissions)) \
-        .filter(FamilyMember.family_id == family_id).all()
+    # One IN query for every member's permissions instead of repeating member rows per permission
+    members = db.query(FamilyMember).options(
+        load_only(FamilyMember.id, FamilyMember.name),
+        selectinload(FamilyMember.permissions).load_only(FamilyMemberPermission.permission),
+    ).filter(FamilyMember.family_id == family_id).all()
 
     result = []
     for member in members:
@@ -1,9 +1,43 @@
+import threading
+
+from cachetools import TTLCache
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.family_role import FamilyRole
 from app.schemas.family_role import FamilyRoleCreate, FamilyRoleUpdate
 
 
+# Per-process family role names keyed by id, read by the role checks on every guarded request.
+# Changes are evicted in this worker only; other workers pick them up once the short TTL expires.
+# Dependencies run in the threadpool, hence the lock.
+_role_name_cache = TTLCache(maxsize=1024, ttl=max(settings.FAMILY_ROLE_CACHE_TTL_SECONDS, 1))
+_role_name_cache_lock = threading.Lock()
+
+
+@event.listens_for(FamilyRole, "after_update")
+@event.listens_for(FamilyRole, "after_delete")
+def _forget_changed_role(mapper, connection, target: FamilyRole) -> None:
+    with _role_name_cache_lock:
+        _role_name_cache.pop(target.id, None)
+
+
+def get_family_role_name(db: Session, role_id: int) -> str | None:
+    """Name of a family role, or None when it does not exist"""
+    if settings.FAMILY_ROLE_CACHE_TTL_SECONDS > 0:
+        with _role_name_cache_lock:
+            name = _role_name_cache.get(role_id)
+        if name is not None:
+            return name
+
+    name = db.query(FamilyRole.name).filter(FamilyRole.id == role_id).scalar()
+    if name is not None and settings.FAMILY_ROLE_CACHE_TTL_SECONDS > 0:
+        with _role_name_cache_lock:
+            _role_name_cache[role_id] = name
+    return name
+
+
 def get_all_family_roles(db: Session) -> list[FamilyRole]:
     return db.query(FamilyRole).order_by(FamilyRole.name.asc()).all()
 
@@ -21,7 +55,7 @@ def create_family_role(db: Session, role_in: FamilyRoleCreate) -> FamilyRole:
 
 
 def update_family_role(db: Session, role_id: int, role_in: FamilyRoleUpdate) -> FamilyRole:
-    role = db.query(FamilyRole).filter(FamilyRole.id == role_id).first()
+    role = db.get(FamilyRole, role_id)
     if not role:
         raise ValueError("Role not found")
 
@@ -44,7 +78,7 @@ def update_family_role(db: Session, role_id: int, role_in: FamilyRoleUpdate) ->
 
 
 def delete_family_role(db: Session, role_id: int) -> None:
-    role = db.query(FamilyRole).filter(FamilyRole.id == role_id).first()
+    role = db.get(FamilyRole, role_id)
     if not role:
         raise ValueError("Role not found")
 
@@ -1,7 +1,8 @@
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func
 from fastapi import HTTPException
+from app.db.loading import lazy_load_guard
 from app.db.session import SessionLocal
 from app.models.feedback import Feedback, Reply
 from app.models.family import Family
@@ -14,7 +15,11 @@ def get_feedback_list(db: Session, status_filter: str = None) -> List[FeedbackRe
     """
     Get all feedback, optionally filtered by status
     """
-    query = db.query(Feedback)
+    query = db.query(Feedback).options(
+        selectinload(Feedback.family),
+        selectinload(Feedback.replies),
+        *lazy_load_guard(),
+    )
     
     if status_filter and status_filter != "all":
         query = query.filter(Feedback.status == status_filter)
@@ -23,7 +28,7 @@ def get_feedback_list(db: Session, status_filter: str = None) -> List[FeedbackRe
     
     result = []
     for feedback in feedback_items:
-        family = db.query(Family).filter(Family.id == feedback.family_id).first()
+        family = feedback.family
         
         # Get replies for this feedback
         replies = []
@@ -59,11 +64,11 @@ def get_feedback_by_id(db: Session, feedback_id: int) -> FeedbackResponse:
     """
     Get a specific feedback item by ID
     """
-    feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
+    feedback = db.get(Feedback, feedback_id)
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
     
-    family = db.query(Family).filter(Family.id == feedback.family_id).first()
+    family = db.get(Family, feedback.family_id)
     
     # Get replies for this feedback
     replies = []
@@ -97,7 +102,7 @@ def create_feedback(db: Session, feedback: FeedbackCreate) -> FeedbackResponse:
     Create a new feedback item
     """
     # Check if family exists
-    family = db.query(Family).filter(Family.id == feedback.family_id).first()
+    family = db.get(Family, feedback.family_id)
     if not family:
         raise HTTPException(status_code=404, detail="Family not found")
     
@@ -135,7 +140,7 @@ def update_feedback(db: Session, feedback_id: int, feedback_update: FeedbackUpda
     """
     Update a feedback item
     """
-    db_feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
+    db_feedback = db.get(Feedback, feedback_id)
     if not db_feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
     
@@ -148,7 +153,7 @@ def update_feedback(db: Session, feedback_id: int, feedback_update: FeedbackUpda
     db.commit()
     db.refresh(db_feedback)
     
-    family = db.query(Family).filter(Family.id == db_feedback.family_id).first()
+    family = db.get(Family, db_feedback.family_id)
     
     # Get replies for this feedback
     replies = []
@@ -183,7 +188,7 @@ def create_reply(db: Session, feedback_id: int, reply: ReplyCreate, author: str
     Create a reply to a feedback item
     """
     # Check if feedback exists
-    feedback = db.query(Feedback).filter(Feedback.id == feedback_id).first()
+    feedback = db.get(Feedback, feedback_id)
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
@@ -1,6 +1,10 @@
 from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.loading import lazy_load_guard
+
 from app.models.organization import (
     OrganizationPosition,
     SmallCommittee,
@@ -15,12 +19,12 @@ from app.schemas.organization import (
 )
 
 
-def list_positions(db: Session):
-    return (
-        db.query(OrganizationPosition)
+async def list_positions(db: AsyncSession):
+    return (await db.scalars(
+        select(OrganizationPosition)
+        .options(*lazy_load_guard())
         .order_by(OrganizationPosition.level.asc(), OrganizationPosition.sort_order.asc().nullslast(), OrganizationPosition.id.asc())
-        .all()
-    )
+    )).all()
 
 
 def create_position(db: Session, payload: OrganizationPositionCreate):
@@ -32,7 +36,7 @@ def create_position(db: Session, payload: OrganizationPositionCreate):
 
 
 def update_position(db: Session, position_id: int, payload: OrganizationPositionUpdate):
-    item = db.query(OrganizationPosition).filter(OrganizationPosition.id == position_id).first()
+    item = db.get(OrganizationPosition, position_id)
     if not item:
         raise HTTPException(status_code=404, detail="Organization position not found")
 
@@ -45,20 +49,22 @@ def update_position(db: Session, position_id: int, payload: OrganizationPosition
 
 
 def delete_position(db: Session, position_id: int) -> None:
-    item = db.query(OrganizationPosition).filter(OrganizationPosition.id == position_id).first()
+    item = db.get(OrganizationPosition, position_id)
     if not item:
         raise HTTPException(status_code=404, detail="Organization position not found")
     db.delete(item)
     db.commit()
 
 
-def list_small_committees(db: Session):
-    return (
-        db.query(SmallCommittee)
-        .options(joinedload(SmallCommittee.departments).joinedload(SmallCommitteeDepartment.members))
+async def list_small_committees(db: AsyncSession):
+    return (await db.scalars(
+        select(SmallCommittee)
+        .options(
+            joinedload(SmallCommittee.departments).joinedload(SmallCommitteeDepartment.members),
+            *lazy_load_guard(),
+        )
         .order_by(SmallCommittee.id.desc())
-        .all()
-    )
+    )).unique().all()
 
 
 def create_small_committee(db: Session, payload: SmallCommitteeCreate):
@@ -146,7 +152,7 @@ def update_small_committee(db: Session, committee_id: int, payload: SmallCommitt
 
 
 def delete_small_committee(db: Session, committee_id: int) -> None:
-    committee = db.query(SmallCommittee).filter(SmallCommittee.id == committee_id).first()
+    committee = db.get(SmallCommittee, committee_id)
     if not committee:
         raise HTTPException(status_code=404, detail="Small committee not found")
     db.delete(committee)
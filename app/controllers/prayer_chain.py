@@ -1,6 +1,7 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException
+from app.db.loading import lazy_load_guard
 from app.models.prayer_chain import PrayerChain, Schedule
 from app.models.family import Family
 from app.models.user import User
@@ -57,11 +58,15 @@ def get_family_details(db: Session, family: Family) -> dict:
 @log_view("prayer_chains", "Viewed all prayer chains")
 def get_all_prayer_chains(db: Session) -> List[PrayerChainResponse]:
     """Get all prayer chains with their schedules and detailed family information"""
-    prayer_chains = db.query(PrayerChain).all()
+    prayer_chains = db.query(PrayerChain).options(
+        selectinload(PrayerChain.family),
+        selectinload(PrayerChain.schedules),
+        *lazy_load_guard(),
+    ).all()
 
     result = []
     for prayer_chain in prayer_chains:
-        family = db.query(Family).filter(Family.id == prayer_chain.family_id).first()
+        family = prayer_chain.family
 
         if not family:
             continue
@@ -94,12 +99,12 @@ def get_all_prayer_chains(db: Session) -> List[PrayerChainResponse]:
 @log_view("prayer_chains", "Viewed prayer chain details")
 def get_prayer_chain_by_id(db: Session, prayer_chain_id: int) -> PrayerChainResponse:
     """Get a specific prayer chain by ID with detailed family information"""
-    prayer_chain = db.query(PrayerChain).filter(PrayerChain.id == prayer_chain_id).first()
+    prayer_chain = db.get(PrayerChain, prayer_chain_id)
 
     if not prayer_chain:
         raise HTTPException(status_code=404, detail="Prayer chain not found")
 
-    family = db.query(Family).filter(Family.id == prayer_chain.family_id).first()
+    family = db.get(Family, prayer_chain.family_id)
     if not family:
         raise HTTPException(status_code=404, detail="Family not found")
 
@@ -132,7 +137,7 @@ def create_or_update_prayer_chain(db: Session, prayer_chain: PrayerChainCreate,
     Smart endpoint: Creates prayer chain on first time, adds schedules on subsequent times
     """
     # Check if family exists
-    family = db.query(Family).filter(Family.id == prayer_chain.family_id).first()
+    family = db.get(Family, prayer_chain.family_id)
     if not family:
         raise HTTPException(status_code=404, detail="Family not found")
 
@@ -209,7 +214,7 @@ def create_or_update_prayer_chain(db: Session, prayer_chain: PrayerChainCreate,
 @log_update("prayer_chains", "Updated prayer chain")
 def update_prayer_chain(db: Session, prayer_chain_id: int, prayer_chain: PrayerChainUpdate) -> PrayerChainResponse:
     """Update an existing prayer chain"""
-    db_prayer_chain = db.query(PrayerChain).filter(PrayerChain.id == prayer_chain_id).first()
+    db_prayer_chain = db.get(PrayerChain, prayer_chain_id)
     if not db_prayer_chain:
         raise HTTPException(status_code=404, detail="Prayer chain not found")
 
@@ -218,7 +223,7 @@ def update_prayer_chain(db: Session, prayer_chain_id: int, prayer_chain: PrayerC
     # If updating family_id, check if the new family exists and doesn't already have a prayer chain
     if "family_id" in update_data:
         new_family_id = update_data["family_id"]
-        family = db.query(Family).filter(Family.id == new_family_id).first()
+        family = db.get(Family, new_family_id)
         if not family:
             raise HTTPException(status_code=404, detail="Family not found")
 
@@ -244,7 +249,7 @@ def update_prayer_chain(db: Session, prayer_chain_id: int, prayer_chain: PrayerC
 @log_delete("prayer_chains", "Deleted prayer chain")
 def delete_prayer_chain(db: Session, prayer_chain_id: int):
     """Delete a prayer chain and all its schedules"""
-    db_prayer_chain = db.query(PrayerChain).filter(PrayerChain.id == prayer_chain_id).first()
+    db_prayer_chain = db.get(PrayerChain, prayer_chain_id)
     if not db_prayer_chain:
         raise HTTPException(status_code=404, detail="Prayer chain not found")
 
@@ -256,7 +261,7 @@ def delete_prayer_chain(db: Session, prayer_chain_id: int):
 @log_create("prayer_schedules", "Added schedule to prayer chain")
 def add_schedule_to_prayer_chain(db: Session, prayer_chain_id: int, schedule: ScheduleCreate) -> ScheduleResponse:
     """Add a new schedule to an existing prayer chain with collision detection"""
-    prayer_chain = db.query(PrayerChain).filter(PrayerChain.id == prayer_chain_id).first()
+    prayer_chain = db.get(PrayerChain, prayer_chain_id)
     if not prayer_chain:
         raise HTTPException(status_code=404, detail="Prayer chain not found")
 
@@ -297,7 +302,7 @@ def add_schedule_to_prayer_chain(db: Session, prayer_chain_id: int, schedule: Sc
 @log_update("prayer_schedules", "Updated prayer schedule")
 def update_schedule(db: Session, schedule_id: int, schedule: ScheduleUpdate) -> ScheduleResponse:
     """Update an existing schedule with collision detection"""
-    db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    db_schedule = db.get(Schedule, schedule_id)
     if not db_schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
@@ -354,7 +359,7 @@ def update_schedule(db: Session, schedule_id: int, schedule: ScheduleUpdate) ->
 @log_delete("prayer_schedules", "Deleted prayer schedule")
 def delete_schedule(db: Session, schedule_id: int):
     """Delete a specific schedule"""
-    db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    db_schedule = db.get(Schedule, schedule_id)
     if not db_schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
@@ -0,0 +1,284 @@
+"""
+Redis cache-aside layer for hot read endpoints.
+
+Caching is optional: when REDIS_URL is not configured, or Redis cannot be reached,
+every call falls straight through to the wrapped handler.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from typing import Any, Callable, Optional
+
+import orjson
+import redis
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.schemas.user import RoleEnum
+from app.utils.http_cache import etag_matches
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = "v1"
+LOCK_TTL_SECONDS = 5
+LOCK_WAIT_SECONDS = 1.0
+LOCK_POLL_SECONDS = 0.05
+# Tag sets outlive every entry TTL so no live entry ever drops out of its tag
+TAG_TTL_SECONDS = 3600
+
+# Handler arguments that never take part in the cache key
+_NON_KEY_ARGS = frozenset({"db", "current_user", "request", "response"})
+# Response headers replayed on cache hits
+_CACHED_HEADERS = ("ETag", "Last-Modified", "Cache-Control", "X-Next-Cursor")
+# Roles whose reads are always restricted to their own family
+_FAMILY_SCOPED_ROLES = frozenset({RoleEnum.pere, RoleEnum.mere})
+# Roles allowed to read any family; everyone else's entries are never shared across families
+_ALL_FAMILIES_ROLES = frozenset({RoleEnum.church_pastor})
+
+_pool: Optional[redis.BlockingConnectionPool] = None
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Return a Redis client backed by the shared connection pool, or None when caching is disabled"""
+    global _pool
+    if not settings.REDIS_URL:
+        return None
+    if _pool is None:
+        _pool = redis.BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=1,
+            socket_timeout=1,
+            socket_connect_timeout=1,
+        )
+    return redis.Redis(connection_pool=_pool)
+
+
+def close_redis() -> None:
+    """Disconnect the shared connection pool (called on application shutdown)"""
+    global _pool
+    if _pool is not None:
+        _pool.disconnect()
+        _pool = None
+
+
+def family_scope(kwargs: dict) -> str:
+    """
+    Family a cached read is restricted to: parents always see their own family,
+    other roles see the requested family_id or everything.
+    """
+    user = kwargs.get("current_user")
+    if user is not None and user.role in _FAMILY_SCOPED_ROLES:
+        return str(user.family_id)
+    family_id = kwargs.get("family_id")
+    return str(family_id) if family_id else "all"
+
+
+def viewer_scope(kwargs: dict) -> str:
+    """
+    Family of the caller a cached read is keyed by. Pastors share entries; any other caller
+    only ever hits entries built for their own family, so a response is never replayed to
+    a user whose authorization check has not already passed for the same family.
+    """
+    user = kwargs.get("current_user")
+    if user is None:
+        return "anonymous"
+    if user.role in _ALL_FAMILIES_ROLES:
+        return "any"
+    return str(user.family_id)
+
+
+def tag_key(namespace: str, scope: str) -> str:
+    """Redis set listing the cached entries of a namespace for one family scope"""
+    return f"{CACHE_VERSION}:tag:{namespace}:family={scope}"
+
+
+def build_cache_key(namespace: str, prefix: str, kwargs: dict) -> str:
+    """Deterministic key: version, namespace, route prefix, caller role and family, family scope and a hash of the params"""
+    user = kwargs.get("current_user")
+    role = getattr(getattr(user, "role", None), "value", "anonymous")
+    params = {k: v for k, v in kwargs.items() if k not in _NON_KEY_ARGS}
+    digest = hashlib.sha1(
+        json.dumps(jsonable_encoder(params), sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return (
+        f"{CACHE_VERSION}:{namespace}:{prefix}:{role}:viewer={viewer_scope(kwargs)}"
+        f":family={family_scope(kwargs)}:{digest}"
+    )
+
+
+def invalidate_family(namespace: str, family_id: Optional[int]) -> None:
+    """
+    Drop cached reads for a family plus the cross-family ("all") entries of a namespace.
+    Entries are found through their tag sets, so the cost follows the number of affected
+    keys rather than the size of the keyspace.
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        tags = [tag_key(namespace, scope) for scope in ({str(family_id), "all"} if family_id else {"all"})]
+        members = {tag: client.smembers(tag) for tag in tags}
+        pipe = client.pipeline(transaction=True)
+        for tag, keys in members.items():
+            if keys:
+                pipe.delete(*keys)
+                # SREM rather than DEL keeps entries tagged concurrently with this invalidation
+                pipe.srem(tag, *keys)
+        pipe.execute()
+    except redis.RedisError as exc:
+        logger.warning(f"Cache invalidation failed for {namespace} family={family_id}: {exc}")
+
+
+def _read_entry(client: redis.Redis, key: str) -> Optional[dict]:
+    raw = client.get(key)
+    return orjson.loads(raw) if raw is not None else None
+
+
+def _replay_entry(entry: dict, kwargs: dict) -> Any:
+    headers = entry.get("headers") or {}
+    request = kwargs.get("request")
+    etag = headers.get("ETag")
+    if etag and request is not None and etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    response = kwargs.get("response")
+    if response is not None:
+        for name, value in headers.items():
+            response.headers[name] = value
+    return entry["body"]
+
+
+def _store_result(client: redis.Redis, key: str, tag: str, ttl: int, result: Any, kwargs: dict) -> None:
+    # Ready-made responses (e.g. 304 Not Modified) are returned as-is, never cached
+    if isinstance(result, Response):
+        return
+
+    headers = {}
+    response = kwargs.get("response")
+    if response is not None:
+        headers = {name: response.headers[name] for name in _CACHED_HEADERS if name in response.headers}
+
+    entry = {"body": jsonable_encoder(result), "headers": headers}
+    try:
+        pipe = client.pipeline(transaction=True)
+        pipe.set(key, orjson.dumps(entry), ex=ttl)
+        pipe.sadd(tag, key)
+        pipe.expire(tag, TAG_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError as exc:
+        logger.warning(f"Cache write failed for {key}: {exc}")
+
+
+def cached(namespace: str, prefix: str, ttl: int):
+    """
+    Cache-aside decorator for route handlers (sync or async).
+
+    Keys are built from the caller's role, family scope and the remaining handler
+    arguments, and each entry is added to its family scope's tag set for invalidation.
+    A short SET NX lock lets a single request rebuild a missing entry while concurrent
+    requests wait briefly for it instead of all hitting the database.
+    """
+    def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            return _cached_async(namespace, prefix, ttl, func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            client = get_redis()
+            if client is None:
+                return func(*args, **kwargs)
+
+            key = build_cache_key(namespace, prefix, kwargs)
+            tag = tag_key(namespace, family_scope(kwargs))
+            lock_key = f"{key}:lock"
+            try:
+                entry = _read_entry(client, key)
+                if entry is not None:
+                    return _replay_entry(entry, kwargs)
+                have_lock = client.set(lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS)
+            except redis.RedisError as exc:
+                logger.warning(f"Cache read failed for {key}: {exc}")
+                return func(*args, **kwargs)
+
+            if have_lock:
+                try:
+                    result = func(*args, **kwargs)
+                    _store_result(client, key, tag, ttl, result, kwargs)
+                    return result
+                finally:
+                    try:
+                        client.delete(lock_key)
+                    except redis.RedisError:
+                        pass
+
+            # Another request is rebuilding this entry; wait briefly for it
+            deadline = time.monotonic() + LOCK_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_SECONDS)
+                try:
+                    entry = _read_entry(client, key)
+                except redis.RedisError:
+                    break
+                if entry is not None:
+                    return _replay_entry(entry, kwargs)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _cached_async(namespace: str, prefix: str, ttl: int, func: Callable):
+    """Async counterpart of the cached() wrapper; blocking Redis calls run in the threadpool"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        client = get_redis()
+        if client is None:
+            return await func(*args, **kwargs)
+
+        key = build_cache_key(namespace, prefix, kwargs)
+        tag = tag_key(namespace, family_scope(kwargs))
+        lock_key = f"{key}:lock"
+        try:
+            entry = await run_in_threadpool(_read_entry, client, key)
+            if entry is not None:
+                return _replay_entry(entry, kwargs)
+            have_lock = await run_in_threadpool(client.set, lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS)
+        except redis.RedisError as exc:
+            logger.warning(f"Cache read failed for {key}: {exc}")
+            return await func(*args, **kwargs)
+
+        if have_lock:
+            try:
+                result = await func(*args, **kwargs)
+                await run_in_threadpool(_store_result, client, key, tag, ttl, result, kwargs)
+                return result
+            finally:
+                try:
+                    await run_in_threadpool(client.delete, lock_key)
+                except redis.RedisError:
+                    pass
+
+        # Another request is rebuilding this entry; wait briefly for it
+        deadline = time.monotonic() + LOCK_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+            try:
+                entry = await run_in_threadpool(_read_entry, client, key)
+            except redis.RedisError:
+                break
+            if entry is not None:
+                return _replay_entry(entry, kwargs)
+
+        return await func(*args, **kwargs)
+
+    return wrapper
@@ -7,9 +7,31 @@ from app.core.env_config import env_manager
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Sync (threadpool) and async (event loop) pools are separate; together they cap the
+    # Postgres connections per worker at DB_POOL_SIZE + DB_MAX_OVERFLOW + the async pair
+    DB_POOL_SIZE: int = 15
+    DB_MAX_OVERFLOW: int = 30
+    DB_ASYNC_POOL_SIZE: int = 5
+    DB_ASYNC_MAX_OVERFLOW: int = 10
+    # Seconds a request waits for a pooled connection before failing with 503
+    DB_POOL_TIMEOUT: float = 2.0
+    DB_POOL_RECYCLE: int = 3600
+    # Connections opened per pool at startup so the first requests skip connect/auth
+    DB_POOL_WARM_CONNECTIONS: int = 5
+    # Compiled SQL statements kept per engine (SQLAlchemy's default is 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Make list queries raise on relationships they did not load explicitly (enable in dev/CI)
+    RAISE_ON_LAZY_LOAD: bool = False
+    # asyncpg URL for the async read routes; derived from DATABASE_URL when unset
+    ASYNC_DATABASE_URL: str | None = None
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    # Seconds an authenticated user's row is reused in-process before re-reading it (0 disables).
+    # Deactivations and role changes are only evicted in the worker that wrote them, so this is
+    # the longest other workers keep accepting the old user state.
+    AUTH_USER_CACHE_TTL_SECONDS: int = 5
+    AUTH_USER_CACHE_SIZE: int = 10_000
 
     SMTP_SERVER: str
     SMTP_PORT: int
@@ -22,6 +44,24 @@ class Settings(BaseSettings):
 
     EMAIL_BRAND_NAME:str = "YouthTrack"
 
+    # Optional Redis cache for hot read endpoints (disabled when unset)
+    REDIS_URL: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 20
+
+    # Internal nginx location aliasing uploads/documents (e.g. "/protected/documents/").
+    # When set, document downloads are handed to nginx via X-Accel-Redirect.
+    DOCUMENT_X_ACCEL_PREFIX: str | None = None
+    # Seconds document statistics are reused in-process between view refreshes (0 disables)
+    DOCUMENT_STATS_CACHE_TTL_SECONDS: int = 5
+    # Seconds the public families list is reused in-process (0 disables)
+    PUBLIC_FAMILIES_CACHE_TTL_SECONDS: int = 60
+    # Seconds a family role's name is reused in-process for role checks (0 disables).
+    # Renames and deletions are only evicted in the worker that made them, so this bounds
+    # how long other workers keep authorizing against the old name.
+    FAMILY_ROLE_CACHE_TTL_SECONDS: int = 5
+    # bcrypt cost for family member invitation passwords (random, so they need less stretching)
+    TEMP_PASSWORD_BCRYPT_ROUNDS: int = 8
+
     # URL Configuration with fallbacks
     ENVIRONMENT: str = "development"
     FRONTEND_URL: str = "http://127.0.0.1:8080"
@@ -5,8 +5,13 @@ from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.user import RoleEnum
 
+# Roles allowed to manage their family's members, activities and documents
+_PARENT_ROLES = frozenset({RoleEnum.pere, RoleEnum.mere})
+
+
 def require_parent(user: User) -> User:
-    if user.role not in (RoleEnum.pere, RoleEnum.mere):
+    # role is a column of the already-loaded (auth-cached) user, so this never queries
+    if user.role not in _PARENT_ROLES:
         raise HTTPException(status_code=403, detail="Only Père or Mère can perform this action.")
     return user
 
@@ -1,12 +1,16 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Iterable
 
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import String
-from sqlalchemy.orm import Session
+from sqlalchemy import String, event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.config import settings
 from app.db.session import SessionLocal, get_db
@@ -16,6 +20,14 @@ from app.schemas.user import RoleEnum
 # Password hashing setup
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Family member invitation passwords carry ~73 bits of randomness and only serve to activate
+# the account (the user then gets a regular password hash), so they are hashed at a lower cost.
+# Temporary passwords that act as a login credential keep pwd_context. verify_password reads
+# the cost back from each hash.
+temp_pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.TEMP_PASSWORD_BCRYPT_ROUNDS
+)
+
 def get_password_hash(password: str) -> str:
     from logging import getLogger
     logger = getLogger(__name__)
@@ -23,6 +35,20 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_temp_password_hash(password: str) -> str:
+    """Hash a generated family member invitation password"""
+    return temp_pwd_context.hash(password)
+
+
+# bcrypt runs in C without the GIL, so a thread pool hashes batches on every core
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+
+def get_temp_password_hashes(passwords: Iterable[str]) -> list[str]:
+    """Hash several invitation passwords in parallel, returning the hashes in input order"""
+    return list(_hash_executor.map(get_temp_password_hash, passwords))
+
+
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
@@ -36,6 +62,53 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
 # OAuth2 setup
 oauth2_scheme = HTTPBearer()
 
+# Short-lived per-process cache of authenticated users' column values, keyed by email.
+# Changes are evicted in this worker only; other workers see them once the short TTL expires.
+# TTLCache is not thread-safe and sync dependencies run in the threadpool, hence the lock.
+_user_cache = TTLCache(maxsize=settings.AUTH_USER_CACHE_SIZE, ttl=max(settings.AUTH_USER_CACHE_TTL_SECONDS, 1))
+_user_cache_lock = threading.Lock()
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+
+def forget_cached_user(email: str | None) -> None:
+    """Drop a user from the authentication cache so the next request re-reads it"""
+    if email:
+        with _user_cache_lock:
+            _user_cache.pop(email, None)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _forget_changed_user(mapper, connection, target: User) -> None:
+    # Covers role/family/password changes and deletions made through the ORM;
+    # the previous email is dropped too when the email itself changed.
+    forget_cached_user(target.email)
+    for old_email in inspect(target).attrs.email.history.deleted:
+        forget_cached_user(old_email)
+
+
+def _load_user_by_email(db: Session, email: str) -> User | None:
+    """
+    Fetch the user for a token, reusing recently loaded column values when possible.
+    Cached values are attached to the request session without a SELECT, so relationships
+    still lazy-load and changes flush as usual.
+    """
+    if settings.AUTH_USER_CACHE_TTL_SECONDS <= 0:
+        return db.query(User).filter(User.email == email).first()
+
+    with _user_cache_lock:
+        values = _user_cache.get(email)
+    if values is None:
+        user = db.query(User).filter(User.email == email).first()
+        if user is not None:
+            with _user_cache_lock:
+                _user_cache[email] = {key: getattr(user, key) for key in _USER_COLUMNS}
+        return user
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
 
 # Extract current user from token
 def get_current_user(
@@ -56,7 +129,7 @@ def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == user_email).first()
+    user = _load_user_by_email(db, user_email)
     if user is None:
         raise credentials_exception
 
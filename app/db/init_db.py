@@ -1,7 +1,10 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.models.user import User
+from app.models.family_member import FamilyMember
 from app.models.family_role import FamilyRole
+from app.models.family_activity import Activity
+from app.models.family_document import FamilyDocument, TYPE_STATUS_CHECK
 from app.models.anti_drugs_unit import (
     AntiDrugsActivity,
     AntiDrugsTestimony,
@@ -19,6 +22,7 @@ from app.core.security import get_password_hash
 from app.db.session import SessionLocal, Base, engine
 from app.core.timestamp_middleware import init_timestamp_middleware
 from app.db.seed_families import seed_families
+from app.controllers.family_document import create_document_stats_view
 import logging
 
 logger = logging.getLogger(__name__)
@@ -172,6 +176,97 @@ def _ensure_family_cover_photo_column() -> None:
             logger.info("Added cover_photo column to families table.")
 
 
+def _ensure_family_document_sha256_column() -> None:
+    """Add sha256 column to family_documents table."""
+    table = "family_documents"
+    with engine.begin() as conn:
+        existing = _get_table_columns(conn, table)
+        dialect = conn.dialect.name
+
+        if "sha256" not in existing:
+            if dialect in {"postgresql", "postgres"}:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS sha256 VARCHAR(64)"))
+            else:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN sha256 VARCHAR(64)"))
+            logger.info("Added sha256 column to family_documents table.")
+
+
+def _ensure_family_activities_indexes() -> None:
+    """Create the activity list/summary indexes on databases created before they existed."""
+    with engine.begin() as conn:
+        for index in Activity.__table__.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+
+def _ensure_family_stats_indexes() -> None:
+    """Create the users/family_members indexes (family stats, member list pages) on databases created before they existed."""
+    with engine.begin() as conn:
+        for table in (User.__table__, FamilyMember.__table__):
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+
+def _ensure_family_member_invitation_unique() -> None:
+    """
+    Add the one-invitation-per-member constraint (behind invitation upserts) to tables created before it.
+    Members with several invitations are never cleaned up here: startup fails until the
+    20261017_add_family_member_invitation_unique.sql migration has resolved them.
+    """
+    with engine.begin() as conn:
+        if conn.dialect.name != "postgresql":
+            return
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_constraint WHERE conname = 'uq_family_member_invitations_member'")
+        ).first()
+        if not exists:
+            duplicated = conn.execute(text(
+                "SELECT count(*) FROM (SELECT member_id FROM family_member_invitations "
+                "GROUP BY member_id HAVING count(*) > 1) AS duplicated"
+            )).scalar()
+            if duplicated:
+                raise RuntimeError(
+                    f"{duplicated} family members have several invitations; run "
+                    "migrations/20261017_add_family_member_invitation_unique.sql before starting the app."
+                )
+            conn.execute(text(
+                "ALTER TABLE family_member_invitations "
+                "ADD CONSTRAINT uq_family_member_invitations_member UNIQUE (member_id)"
+            ))
+            logger.info("Added uq_family_member_invitations_member constraint to family_member_invitations table.")
+
+
+def _ensure_family_documents_indexes() -> None:
+    """Create the document list indexes on databases created before they existed."""
+    with engine.begin() as conn:
+        for index in FamilyDocument.__table__.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+
+def _ensure_family_document_status_check() -> None:
+    """Add the (type, status) CHECK constraint to family_documents tables created before it existed."""
+    with engine.begin() as conn:
+        if conn.dialect.name != "postgresql":
+            return
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_constraint WHERE conname = 'ck_family_documents_type_status'")
+        ).first()
+        if not exists:
+            # NOT VALID: enforced for new writes without failing on legacy rows
+            conn.execute(text(
+                "ALTER TABLE family_documents ADD CONSTRAINT ck_family_documents_type_status "
+                f"CHECK ({TYPE_STATUS_CHECK}) NOT VALID"
+            ))
+            logger.info("Added ck_family_documents_type_status constraint to family_documents table.")
+
+
+def _ensure_family_document_stats_view() -> None:
+    """Create the per-family document counters view backing the document statistics endpoints."""
+    with engine.begin() as conn:
+        if conn.dialect.name != "postgresql":
+            return
+        create_document_stats_view(conn)
+
+
 def init_db():
     # Initialize timestamp middleware
     init_timestamp_middleware()
@@ -184,6 +279,13 @@ def init_db():
     _ensure_users_name_and_role_columns()
     _ensure_family_member_extended_columns()
     _ensure_family_cover_photo_column()
+    _ensure_family_document_sha256_column()
+    _ensure_family_activities_indexes()
+    _ensure_family_stats_indexes()
+    _ensure_family_member_invitation_unique()
+    _ensure_family_documents_indexes()
+    _ensure_family_document_status_check()
+    _ensure_family_document_stats_view()
 
     db: Session = SessionLocal()
 
@@ -0,0 +1,16 @@
+"""
+ORM loader options shared by list queries.
+"""
+
+from sqlalchemy.orm import raiseload
+
+from app.core.config import settings
+
+
+def lazy_load_guard() -> tuple:
+    """
+    raiseload("*") when RAISE_ON_LAZY_LOAD is set, so a relationship a list query did not
+    load explicitly fails loudly in development instead of issuing one SELECT per row.
+    Place it after the query's explicit eager-load options.
+    """
+    return (raiseload("*"),) if settings.RAISE_ON_LAZY_LOAD else ()
@@ -1,14 +1,39 @@
-from sqlalchemy import create_engine
+import asyncio
+from contextlib import ExitStack
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from app.core.config import settings
 
-# SQLAlchemy DB engine
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+# SQLAlchemy DB engine; pool limits are sized for the threadpool serving sync routes
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
 
 # Create session local class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) for read-only routes that run on the event loop, with its own pool budget
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 # Base class for all models
 Base = declarative_base()
 
@@ -18,4 +43,30 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    """Yield an async DB session for read-only async routes."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _warm_connection_count(pool_size: int) -> int:
+    return max(0, min(settings.DB_POOL_WARM_CONNECTIONS, pool_size))
+
+
+def warm_db_pool() -> None:
+    """Open the startup connections of the sync pool (held together so each one is a new connection)."""
+    with ExitStack() as stack:
+        for _ in range(_warm_connection_count(settings.DB_POOL_SIZE)):
+            stack.enter_context(engine.connect()).execute(text("SELECT 1"))
+
+
+async def warm_async_db_pool() -> None:
+    """Open the startup connections of the async pool concurrently."""
+    async def ping(_: int) -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping(i) for i in range(_warm_connection_count(settings.DB_ASYNC_POOL_SIZE))))
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Enum, ForeignKey, Text, DateTime, Time
+from sqlalchemy import Column, Integer, String, Date, Enum, ForeignKey, Text, DateTime, Time, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -50,3 +50,51 @@ class Activity(Base):
         passive_deletes=True,
     )
 
+
+# Indexes backing the activity list filters/sorts (family/status + coalesced start date)
+# and the created_at/updated_at range filters used by the summary endpoints.
+Index(
+    "ix_family_activities_family_start",
+    Activity.family_id,
+    func.coalesce(Activity.start_date, Activity.date).desc(),
+)
+Index(
+    "ix_family_activities_status_start",
+    Activity.status,
+    func.coalesce(Activity.start_date, Activity.date).desc(),
+)
+# Family dashboards filter by status/category within a family and sort by start date.
+Index(
+    "ix_family_activities_family_status_start",
+    Activity.family_id,
+    Activity.status,
+    func.coalesce(Activity.start_date, Activity.date).desc(),
+)
+Index(
+    "ix_family_activities_family_category_start",
+    Activity.family_id,
+    Activity.category,
+    func.coalesce(Activity.start_date, Activity.date).desc(),
+)
+# Matches the default /all ordering so keyset pages are read straight off the index.
+Index(
+    "ix_family_activities_start_family_id",
+    func.coalesce(Activity.start_date, Activity.date).desc(),
+    Activity.family_id,
+    Activity.id,
+)
+# Only planned/ongoing rows can be overdue or due for promotion; keep that index small.
+Index(
+    "ix_family_activities_open_end",
+    func.coalesce(Activity.end_date, Activity.date),
+    Activity.family_id,
+    postgresql_where=Activity.status.in_([ActivityStatusEnum.planned, ActivityStatusEnum.ongoing]),
+)
+# Family stats count a family's recent and upcoming activities by their (coalesced) end date.
+Index(
+    "ix_family_activities_family_end",
+    Activity.family_id,
+    func.coalesce(Activity.end_date, Activity.date),
+)
+Index("ix_family_activities_created_at", Activity.created_at)
+Index("ix_family_activities_updated_at", Activity.updated_at)
@@ -1,17 +1,28 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Enum as SqlEnum, String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import CheckConstraint, Column, Enum as SqlEnum, String, DateTime, Integer, ForeignKey, Text, Index
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.session import Base
-from app.schemas.family_document import DocumentType
+from app.schemas.family_document import DocumentType, ReportStatus, LetterStatus
+
+# Statuses each document type may take, enforced by the database on every write
+DOCUMENT_TYPE_STATUSES = {DocumentType.report: ReportStatus, DocumentType.letter: LetterStatus}
+TYPE_STATUS_CHECK = " OR ".join(
+    f"(type = '{doc_type.name}' AND status IN ({', '.join(repr(s.value) for s in statuses)}))"
+    for doc_type, statuses in DOCUMENT_TYPE_STATUSES.items()
+)
 
 class FamilyDocument(Base):
     __tablename__ = "family_documents"
+    __table_args__ = (CheckConstraint(TYPE_STATUS_CHECK, name="ck_family_documents_type_status"),)
 
     id = Column(Integer, primary_key=True, index=True)
     family_id = Column(Integer, ForeignKey("families.id"), nullable=False)
     file_path = Column(String, nullable=True)
+    # Hex SHA-256 of the stored file, computed while streaming the upload; serves as the download ETag
+    sha256 = Column(String(64), nullable=True)
     type = Column(SqlEnum(DocumentType), nullable=False)
     status = Column(String, nullable=False,default="pending")
     original_filename = Column(String, nullable=False)
@@ -24,3 +35,25 @@ class FamilyDocument(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Keep for backward compatibility
+
+    # lazy="raise": the family must be loaded explicitly (joined/eager) so list endpoints never N+1
+    family = relationship("Family", lazy="raise")
+
+
+# Keyset pagination indexes for the family and admin document lists (uploaded_at desc, id desc)
+Index(
+    "ix_family_documents_family_uploaded_id",
+    FamilyDocument.family_id,
+    FamilyDocument.uploaded_at.desc(),
+    FamilyDocument.id.desc(),
+)
+Index("ix_family_documents_uploaded_id", FamilyDocument.uploaded_at.desc(), FamilyDocument.id.desc())
+# Admin list filtered by status (e.g. the pending review queue) in list order
+Index(
+    "ix_family_documents_status_uploaded_id",
+    FamilyDocument.status,
+    FamilyDocument.uploaded_at.desc(),
+    FamilyDocument.id.desc(),
+)
+# max(updated_at) + count per family for the document list ETag, answered from the index alone
+Index("ix_family_documents_family_updated", FamilyDocument.family_id, FamilyDocument.updated_at, FamilyDocument.id)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, Boolean, Date, Enum, ForeignKey, UniqueConstraint, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, Date, Enum, ForeignKey, UniqueConstraint, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -11,6 +11,10 @@ from app.models.bcc_class_completion import BccClassCompletion
 
 class FamilyMemberInvitation(Base):
     __tablename__ = "family_member_invitations"
+    __table_args__ = (
+        # One invitation per member; resends upsert on it
+        UniqueConstraint("member_id", name="uq_family_member_invitations_member"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, ForeignKey("family_members.id", ondelete="CASCADE"))
@@ -41,6 +45,11 @@ class FamilyMember(Base):
         UniqueConstraint("phone", name="uq_member_phone"),
         UniqueConstraint("email", name="uq_member_email"),
         UniqueConstraint("name", "family_id", name="uq_family_name"),
+        # Covers the family stats age/BCC graduate counters so they read only the index
+        Index("ix_family_members_family_dob_graduation", "family_id", "date_of_birth", "year_of_graduation"),
+        # Timestamp-sorted member list pages: family filter, sort key and id tiebreak in one index
+        Index("ix_family_members_family_created", "family_id", "created_at", "id"),
+        Index("ix_family_members_family_updated", "family_id", "updated_at", "id"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -1,5 +1,5 @@
 from pydantic import EmailStr
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,6 +9,10 @@ from app.schemas.user import GenderEnum, FamilyCategoryEnum, RoleEnum
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Family stats count a family's users and those created this month straight off this index
+        Index("ix_users_family_created", "family_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String, nullable=False)
@@ -48,6 +48,26 @@ class DocumentOut(BaseModel, TimestampMixin):
         from_attributes = True
 
 
+class DocumentFamilyOut(BaseModel):
+    """Family details embedded in the admin document list"""
+    id: int
+    category: str
+    name: str
+    created_at: datetime
+    updated_at: datetime
+
+    @field_serializer('created_at', 'updated_at')
+    def serialize_timestamps(self, value: datetime, _info):
+        return value.isoformat()
+
+    class Config:
+        from_attributes = True
+
+
+class AdminDocumentOut(DocumentOut):
+    family: DocumentFamilyOut
+
+
 class ReportCreate(BaseModel):
     title: str
     report_data: dict[str, Any]
@@ -141,6 +141,14 @@ class MemberActivationResponse(BaseModel):
     message: str
     user_id: int
 
+class BulkResendInvitationRequest(BaseModel):
+    member_ids: List[int]
+
+class BulkResendInvitationResponse(BaseModel):
+    queued: List[int]
+    skipped: List[int]  # no email address, or account already activated
+    not_found: List[int]
+
 class AgeDistribution(BaseModel):
     twenty_to_twenty_two: float
     twenty_three_to_twenty_five: float
@@ -1,4 +1,5 @@
 import smtplib
+import threading
 import urllib
 import logging
 import html
@@ -31,6 +32,11 @@ class EmailService:
         self.brand_color = getattr(settings, "EMAIL_BRAND_COLOR", "#2563EB")
         self.brand_logo_url = getattr(settings, "EMAIL_LOGO_URL", None)
 
+        # One SMTP session per worker thread, kept open between sends (smtplib is not thread-safe)
+        self._smtp_local = threading.local()
+        self._smtp_sessions = set()
+        self._smtp_lock = threading.Lock()
+
     def _build_email_html(
             self,
             *,
@@ -171,8 +177,42 @@ class EmailService:
             logger.error(f"Error sending email via Resend: {str(e)}")
             return False
 
+    def _connect_smtp(self) -> smtplib.SMTP:
+        if self.smtp_use_ssl:
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server.starttls()
+        server.login(self.smtp_username, self.smtp_password)
+        return server
+
+    def _get_smtp_session(self) -> smtplib.SMTP:
+        """Return this thread's SMTP session, reconnecting when a NOOP shows the server dropped it"""
+        server = getattr(self._smtp_local, "server", None)
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard_smtp_session(server)
+
+        server = self._connect_smtp()
+        self._smtp_local.server = server
+        with self._smtp_lock:
+            self._smtp_sessions.add(server)
+        return server
+
+    def _discard_smtp_session(self, server: smtplib.SMTP) -> None:
+        self._smtp_local.server = None
+        with self._smtp_lock:
+            self._smtp_sessions.discard(server)
+        try:
+            server.close()
+        except Exception:
+            pass
+
     def _send_email_via_smtp(self, to_email: str, subject: str, plain_body: str, html_body: Optional[str] = None) -> bool:
-        server = None
         try:
             msg = MIMEMultipart('alternative')
             msg['From'] = self.from_email
@@ -182,26 +222,33 @@ class EmailService:
             if html_body:
                 msg.attach(MIMEText(html_body, 'html', 'utf-8'))
 
-            if self.smtp_use_ssl:
-                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
-            else:
-                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                server.starttls()
-
-            server.login(self.smtp_username, self.smtp_password)
-            server.sendmail(self.from_email, to_email, msg.as_string())
+            server = self._get_smtp_session()
+            try:
+                server.sendmail(self.from_email, to_email, msg.as_string())
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the NOOP and the send; retry once on a fresh session
+                self._discard_smtp_session(server)
+                self._get_smtp_session().sendmail(self.from_email, to_email, msg.as_string())
             return True
         except Exception as e:
             logger.error(f"Error sending email via SMTP: {str(e)}")
+            server = getattr(self._smtp_local, "server", None)
+            if server is not None:
+                self._discard_smtp_session(server)
             return False
-        finally:
+
+    def close(self) -> None:
+        """Quit every open SMTP session (called on application shutdown)"""
+        with self._smtp_lock:
+            sessions, self._smtp_sessions = self._smtp_sessions, set()
+        for server in sessions:
             try:
-                if server is not None:
-                    server.quit()
+                server.quit()
             except Exception:
                 pass
 
-    def generate_temporary_password(self, length: int = 12) -> str:
+    @staticmethod
+    def generate_temporary_password(length: int = 12) -> str:
         """Generate a secure temporary password"""
         characters = string.ascii_letters + string.digits + "!@#$%^&*"
         return ''.join(secrets.choice(characters) for _ in range(length))
@@ -321,3 +368,7 @@ class EmailService:
         except Exception as e:
             logger.error(f"Error sending email: {str(e)}")
             return False
+
+
+# Global service instance
+email_service = EmailService()
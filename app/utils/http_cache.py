@@ -0,0 +1,60 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified / 304 Not Modified).
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Per-user responses that clients may reuse briefly but must revalidate afterwards
+PRIVATE_REVALIDATE = "private, max-age=30, must-revalidate"
+# Per-user files whose bytes never change in place (each upload gets a new path)
+PRIVATE_FILE = "private, max-age=3600"
+# Public responses that clients may reuse briefly but must revalidate afterwards
+PUBLIC_REVALIDATE = "public, max-age=30, must-revalidate"
+
+
+def build_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values that determine a response body"""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the given ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (candidate.strip() for candidate in header.split(","))
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: Optional[str] = None,
+) -> None:
+    """Attach ETag and (when known) Last-Modified / Cache-Control headers to a response"""
+    response.headers["ETag"] = etag
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        response.headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: Optional[str] = None,
+) -> Response:
+    """Empty 304 response carrying the validators of the unchanged representation"""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, last_modified, cache_control)
+    return response
@@ -1,16 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 import asyncio
+import logging
 import os
 
 from app.api.routes import user, auth, family_member, family_activity ,family_document, announcement, shared_document,family,prayer_chain, timestamp_analytics, chat, websocket, analytics, recommendation, feedback, config, dashboard, public_checkin, public_qr, family_role, bcc, anti_drugs_unit, worship_team, organization
 from app.api.endpoints import system_logs
 from app.core.logging_middleware import LoggingMiddleware
 from dotenv import load_dotenv
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from app.db.init_db import init_db
 from app.core.websocket_manager import start_cleanup_task
+from app.core.cache import close_redis
+from app.services.email_service import email_service
+from app.db.session import engine, async_engine, warm_db_pool, warm_async_db_pool
 from app.core.logging_config import setup_logging
 
 load_dotenv()
@@ -18,23 +24,63 @@ load_dotenv()
 # Setup logging configuration
 setup_logging()
 
-app = FastAPI()
+# orjson renders response bodies considerably faster than the stdlib encoder on large lists
+app = FastAPI(default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    # Open pooled connections up front so the first requests don't pay connect + auth
+    try:
+        warm_db_pool()
+        await warm_async_db_pool()
+    except Exception as exc:
+        logger.warning(f"Database pool warm-up failed: {exc}")
     # Start WebSocket cleanup task
     asyncio.create_task(start_cleanup_task())
 
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    # Every pooled connection stayed busy for DB_POOL_TIMEOUT: shed load instead of queueing
+    logger.warning(f"Database pool exhausted on {request.method} {request.url.path}")
+    return ORJSONResponse(
+        status_code=503,
+        content={"detail": "Service temporarily overloaded, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    close_redis()
+    email_service.close()
+    engine.dispose()
+    await async_engine.dispose()
+
 from app.core.config import settings
 
+
+# Registered before CORSMiddleware so it runs inside it: the 500 still carries CORS headers,
+# unlike an exception_handler(Exception), which Starlette calls outside every middleware
+@app.middleware("http")
+async def unhandled_exception_middleware(request: Request, call_next):
+    try:
+        return await call_next(request)
+    except Exception as exc:
+        # Uncaught errors become one structured 500; the traceback goes to the log, not the client
+        logger.error(f"Unhandled error on {request.method} {request.url.path}", exc_info=exc)
+        return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"]
+    expose_headers=["Content-Disposition", "X-Next-Cursor"]
 )
 
 # Add logging middleware
@@ -0,0 +1,20 @@
+-- Adds composite indexes for the family activity filters/sorts:
+--   * family + status / family + category with the coalesced start date, for filtered family views
+--   * the default /all ordering (start date desc, family_id, id), so keyset pages read off the index
+--   * a partial index over open (planned/ongoing) activities for the overdue and promotion checks
+-- The activity "date" used for ordering is COALESCE(start_date, date), matching the existing indexes.
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_family_status_start
+  ON family_activities (family_id, status, (COALESCE(start_date, date)) DESC);
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_family_category_start
+  ON family_activities (family_id, category, (COALESCE(start_date, date)) DESC);
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_start_family_id
+  ON family_activities ((COALESCE(start_date, date)) DESC, family_id, id);
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_open_end
+  ON family_activities ((COALESCE(end_date, date)), family_id)
+  WHERE status IN ('planned', 'ongoing');
+
+ANALYZE family_activities;
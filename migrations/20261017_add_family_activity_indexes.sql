@@ -0,0 +1,16 @@
+-- Adds indexes backing the family activity list filters/sorts and summary date filters.
+-- This project uses raw SQL migrations (see existing migrations/*.sql).
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_family_start
+  ON family_activities (family_id, (COALESCE(start_date, date)) DESC);
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_status_start
+  ON family_activities (status, (COALESCE(start_date, date)) DESC);
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_created_at
+  ON family_activities (created_at);
+
+CREATE INDEX IF NOT EXISTS ix_family_activities_updated_at
+  ON family_activities (updated_at);
+
+ANALYZE family_activities;
@@ -0,0 +1,12 @@
+-- Indexes for the remaining document predicates:
+--   * the admin list filtered by status, read in list order (uploaded_at desc, id desc)
+--   * max(updated_at) / count(*) per family behind the family document list ETag (index-only scan)
+-- Per-type/per-status counts are served by mv_family_document_stats and need no index here.
+
+CREATE INDEX IF NOT EXISTS ix_family_documents_status_uploaded_id
+  ON family_documents (status, uploaded_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_family_documents_family_updated
+  ON family_documents (family_id, updated_at, id);
+
+ANALYZE family_documents;
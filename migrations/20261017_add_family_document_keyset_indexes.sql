@@ -0,0 +1,11 @@
+-- Keyset (cursor) pagination for the document lists: pages are read as
+--   WHERE (uploaded_at, id) < (:cursor_uploaded_at, :cursor_id) ORDER BY uploaded_at DESC, id DESC
+-- per family (family list) and across all families (admin list).
+
+CREATE INDEX IF NOT EXISTS ix_family_documents_family_uploaded_id
+  ON family_documents (family_id, uploaded_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_family_documents_uploaded_id
+  ON family_documents (uploaded_at DESC, id DESC);
+
+ANALYZE family_documents;
@@ -0,0 +1,4 @@
+-- Content hash of uploaded document files, used as the download ETag.
+-- Filled in at upload time; documents uploaded earlier keep NULL and are served without it.
+
+ALTER TABLE family_documents ADD COLUMN IF NOT EXISTS sha256 VARCHAR(64);
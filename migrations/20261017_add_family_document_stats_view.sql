@@ -0,0 +1,17 @@
+-- Per-family document counters backing /family-documents/all-docs/stats and /admin/stats/global.
+-- The API refreshes the view (CONCURRENTLY, hence the unique index) after every document write.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_family_document_stats AS
+SELECT family_id,
+       count(id) AS total,
+       count(id) FILTER (WHERE type = 'report') AS reports,
+       count(id) FILTER (WHERE type = 'letter') AS letters,
+       count(id) FILTER (WHERE status = 'pending') AS pending,
+       count(id) FILTER (WHERE status = 'approved') AS approved,
+       count(id) FILTER (WHERE status = 'reviewed') AS reviewed,
+       count(id) FILTER (WHERE status = 'submitted') AS submitted
+FROM family_documents
+GROUP BY family_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_family_document_stats_family_id
+  ON mv_family_document_stats (family_id);
@@ -0,0 +1,12 @@
+-- Only allow statuses valid for the document type:
+--   report: submitted, pending
+--   letter: pending, reviewed, approved
+-- Added NOT VALID so existing rows are not checked; run the VALIDATE step once legacy data is clean.
+
+ALTER TABLE family_documents
+  ADD CONSTRAINT ck_family_documents_type_status
+  CHECK ((type = 'report' AND status IN ('submitted', 'pending'))
+      OR (type = 'letter' AND status IN ('pending', 'reviewed', 'approved')))
+  NOT VALID;
+
+-- ALTER TABLE family_documents VALIDATE CONSTRAINT ck_family_documents_type_status;
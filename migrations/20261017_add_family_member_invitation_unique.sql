@@ -0,0 +1,19 @@
+-- One invitation per family member, so invitation resends can upsert with
+-- INSERT ... ON CONFLICT (member_id) DO UPDATE instead of read-then-write.
+-- Members with several invitations keep one: an activated invitation when they
+-- have one (it is what the member signed up with), otherwise the newest.
+
+DELETE FROM family_member_invitations
+  WHERE id IN (
+    SELECT id FROM (
+      SELECT id, row_number() OVER (
+        PARTITION BY member_id
+        ORDER BY COALESCE(is_activated, false) DESC, id DESC
+      ) AS keep_rank
+      FROM family_member_invitations
+    ) ranked
+    WHERE keep_rank > 1
+  );
+
+ALTER TABLE family_member_invitations
+  ADD CONSTRAINT uq_family_member_invitations_member UNIQUE (member_id);
@@ -0,0 +1,12 @@
+-- Adds the indexes behind the timestamp-sorted member list (/family/family-members/?sort_by=...):
+--   * family_members (family_id, created_at, id) / (family_id, updated_at, id): a family's
+--     members are read in sort order and each keyset page seeks straight past the
+--     (timestamp, id) cursor; both directions use the same index
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_family_members_family_created
+  ON family_members (family_id, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_family_members_family_updated
+  ON family_members (family_id, updated_at, id);
+
+ANALYZE family_members;
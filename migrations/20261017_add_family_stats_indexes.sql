@@ -0,0 +1,19 @@
+-- Adds the indexes behind the family stats endpoint (/family/family-members/{family_id}/stats):
+--   * users (family_id, created_at): total and this-month user counts read off the index
+--   * family_members (family_id, date_of_birth, year_of_graduation): age buckets and BCC
+--     graduate counts are answered by an index-only scan
+--   * family_activities (family_id, COALESCE(end_date, date)): active/weekly/engagement counters
+--     and the activity trends range-scan a family's recent activities
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_family_created
+  ON users (family_id, created_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_family_members_family_dob_graduation
+  ON family_members (family_id, date_of_birth, year_of_graduation);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_family_activities_family_end
+  ON family_activities (family_id, (COALESCE(end_date, date)));
+
+ANALYZE users;
+ANALYZE family_members;
+ANALYZE family_activities;